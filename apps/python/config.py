@@ -1,18 +1,45 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Load environment variables once per process; the values land in os.environ,
+# so reloads and child processes don't need to parse .env again
+if not os.environ.get("_DOTENV_LOADED"):
+    load_dotenv()
+    os.environ["_DOTENV_LOADED"] = "1"
+
+# Read-only snapshot of all settings
+CONFIG = MappingProxyType(
+    {
+        # OpenAI Configuration
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
+        # PostgreSQL Configuration
+        "POSTGRESQL_HOST": os.getenv("POSTGRESQL_HOST"),
+        "POSTGRESQL_PORT": os.getenv("POSTGRESQL_PORT"),
+        "POSTGRESQL_DB": os.getenv("POSTGRESQL_DB"),
+        "POSTGRESQL_USER": os.getenv("POSTGRESQL_USER"),
+        "POSTGRESQL_PASSWORD": os.getenv("POSTGRESQL_PASSWORD"),
+        # SEC Edgar Configuration
+        "SEC_EDGAR_IDENTITY": os.getenv("SEC_EDGAR_IDENTITY"),
+        # Local cache for downloaded reference data
+        "CACHE_DIR": os.path.expanduser(
+            os.getenv("SEC_RAG_CACHE_DIR", "~/.cache/sec-filing-rag")
+        ),
+    }
+)
 
 # OpenAI Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+OPENAI_API_KEY = CONFIG["OPENAI_API_KEY"]
 
 # PostgreSQL Configuration
-POSTGRESQL_HOST = os.getenv("POSTGRESQL_HOST")
-POSTGRESQL_PORT = os.getenv("POSTGRESQL_PORT")
-POSTGRESQL_DB = os.getenv("POSTGRESQL_DB")
-POSTGRESQL_USER = os.getenv("POSTGRESQL_USER")
-POSTGRESQL_PASSWORD = os.getenv("POSTGRESQL_PASSWORD")
+POSTGRESQL_HOST = CONFIG["POSTGRESQL_HOST"]
+POSTGRESQL_PORT = CONFIG["POSTGRESQL_PORT"]
+POSTGRESQL_DB = CONFIG["POSTGRESQL_DB"]
+POSTGRESQL_USER = CONFIG["POSTGRESQL_USER"]
+POSTGRESQL_PASSWORD = CONFIG["POSTGRESQL_PASSWORD"]
 
 # SEC Edgar Configuration
-SEC_EDGAR_IDENTITY = os.getenv("SEC_EDGAR_IDENTITY")
+SEC_EDGAR_IDENTITY = CONFIG["SEC_EDGAR_IDENTITY"]
+
+# Cache Configuration
+CACHE_DIR = CONFIG["CACHE_DIR"]
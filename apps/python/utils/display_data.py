@@ -4,12 +4,30 @@ Provides consistent table formatting across different data types.
 """
 
 import pandas as pd
-from typing import Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, List, Dict, Sequence, Union
 from tabulate import tabulate
 
+if TYPE_CHECKING:
+    from utils.stock_list import SecCompany
+
+# Above this many rows a "grid" table is rendered as a plain column layout
+# through pandas instead of tabulate's per-row separators and cell parsing
+GRID_MAX_ROWS = 50
+
+
+def _render_large_table(table_data: List[tuple], headers: List[str]) -> str:
+    """Render rows as left-aligned columns using pandas' column formatters."""
+    df = pd.DataFrame(table_data, columns=headers).astype(object).fillna("")
+    df = df.astype(str)
+    formatters = {}
+    for column in headers:
+        width = max(len(column), int(df[column].str.len().max()))
+        formatters[column] = lambda value, width=width: value.ljust(width)
+    return df.to_string(index=False, justify="left", formatters=formatters)
+
 
 def display_table(
-    data: List[Dict],
+    data: List[Union[Dict, Sequence]],
     title: str = "Data Table",
     headers: List[str] = None,
     limit: Optional[int] = None,
@@ -20,11 +38,13 @@ def display_table(
     Display data in a formatted table with consistent styling.
 
     Args:
-        data: List of dictionaries containing the data to display
+        data: List of dictionaries containing the data to display, or of
+              value tuples/lists in header order
         title: Title to display above the table
         headers: List of column headers (auto-generated if None)
         limit: Maximum number of rows to display (default: 20)
-        table_format: Table format for tabulate (default: "grid")
+        table_format: Table format for tabulate (default: "grid"; tables with
+                      more than GRID_MAX_ROWS rows use a plain column layout)
         column_config: Dictionary with column-specific configuration
                       Format: {"column_name": {"max_width": 50, "truncate": True}}
     """
@@ -44,36 +64,69 @@ def display_table(
     if headers is None and data:
         headers = list(data[0].keys()) if isinstance(data[0], dict) else []
 
-    for i, record in enumerate(data[:display_limit]):
-        if isinstance(record, dict):
-            row = []
-            for header in headers:
-                value = record.get(header, "N/A")
-
-                # Apply column-specific formatting if configured
-                if column_config and header in column_config:
-                    config = column_config[header]
-                    max_width = config.get("max_width", None)
-                    truncate = config.get("truncate", True)
-
-                    if max_width and truncate and len(str(value)) > max_width:
-                        value = str(value)[: max_width - 3] + "..."
-
-                row.append(value)
-            table_data.append([i + 1] + row)
-        else:
-            # Handle non-dictionary data
-            table_data.append([i + 1, str(record)] + ["N/A"] * (len(headers) - 1))
+    # Resolve column-specific formatting once: (column index, max_width) for
+    # every column that needs truncating
+    column_config = column_config or {}
+    truncated_columns = []
+    for index, header in enumerate(headers):
+        config = column_config.get(header, {})
+        max_width = config.get("max_width", None)
+        if max_width and config.get("truncate", True):
+            truncated_columns.append((index, max_width))
+
+    def truncate(row: List) -> List:
+        for index, max_width in truncated_columns:
+            text = str(row[index])
+            if len(text) > max_width:
+                row[index] = text[: max_width - 3] + "..."
+        return row
+
+    def dict_row(record: Dict) -> List:
+        get = record.get
+        return truncate([get(header, "N/A") for header in headers])
+
+    def sequence_row(record: Sequence) -> List:
+        # Values are positional, in header order; short rows are padded
+        row = list(record[: len(headers)])
+        row.extend(pad[len(row) :])
+        return truncate(row)
+
+    # Padding for rows with fewer values than headers, shared by every row
+    pad = ("N/A",) * len(headers)
+
+    # Positional rows need headers to map onto; without them each row is
+    # shown as a single string, like any other non-dictionary record
+    records = data[:display_limit]
+    if all(isinstance(record, dict) for record in records):
+        # Common case: every record is a dictionary, no per-row type check
+        for i, record in enumerate(records):
+            table_data.append((i + 1, *dict_row(record)))
+    elif headers and all(isinstance(record, (tuple, list)) for record in records):
+        # Rows given as value tuples, e.g. [(field, value), ...]
+        for i, record in enumerate(records):
+            table_data.append((i + 1, *sequence_row(record)))
+    else:
+        for i, record in enumerate(records):
+            if isinstance(record, dict):
+                table_data.append((i + 1, *dict_row(record)))
+            elif headers and isinstance(record, (tuple, list)):
+                table_data.append((i + 1, *sequence_row(record)))
+            else:
+                # Handle scalar data
+                table_data.append((i + 1, str(record), *pad[1:]))
 
     # Create table with row numbers
     table_headers = ["#"] + headers
-    table = tabulate(
-        table_data,
-        headers=table_headers,
-        tablefmt=table_format,
-        stralign="left",
-        numalign="left",
-    )
+    if table_format == "grid" and len(table_data) > GRID_MAX_ROWS:
+        table = _render_large_table(table_data, table_headers)
+    else:
+        table = tabulate(
+            tuple(table_data),
+            headers=table_headers,
+            tablefmt=table_format,
+            stralign="left",
+            numalign="left",
+        )
     print(table)
 
     if len(data) > display_limit:
@@ -93,30 +146,19 @@ def display_stock_data(
 
     title = f"📈 {exchange.upper()} Stock Symbols" if exchange else "📈 Stock Data"
 
-    # Format and map data to consistent field names
-    formatted_data = []
-    for record in data:
-        # Map NASDAQ API fields to our display fields
-        formatted_record = {
-            "symbol": record.get("symbol", "N/A"),
-            "name": record.get("name", "N/A"),
-            "sector": record.get("sector", "N/A"),
-            "industry": record.get("industry", "N/A"),
-            "ipoyear": record.get("ipoyear", "N/A"),
-            "exchange": record.get("exchange", "N/A"),
-        }
-
-        # Format IPO year
-        ipoyear = formatted_record["ipoyear"]
-        if ipoyear != "N/A" and pd.notna(ipoyear) and str(ipoyear).strip():
-            try:
-                formatted_record["ipoyear"] = str(int(float(ipoyear)))
-            except (ValueError, TypeError):
-                formatted_record["ipoyear"] = "N/A"
-        else:
-            formatted_record["ipoyear"] = "N/A"
-
-        formatted_data.append(formatted_record)
+    # Define headers for stock data
+    headers = ["symbol", "name", "sector", "industry", "ipoyear", "exchange"]
+
+    # Map NASDAQ API fields to our display fields in one vectorized pass
+    df = pd.DataFrame.from_records(data).reindex(columns=headers).astype(object)
+    df = df.where(df.notna(), "N/A")
+
+    # Format IPO year as a whole number, or N/A when missing or non-numeric
+    ipoyear = pd.to_numeric(df["ipoyear"], errors="coerce")
+    ipoyear = ipoyear.mask(ipoyear.abs() == float("inf")).dropna()
+    df["ipoyear"] = ipoyear.astype("int64").astype(str).reindex(df.index).fillna("N/A")
+
+    formatted_data = df.to_dict("records")
 
     # Define column configuration for stock data
     column_config = {
@@ -125,9 +167,6 @@ def display_stock_data(
         "industry": {"max_width": 20, "truncate": True},
     }
 
-    # Define headers for stock data
-    headers = ["symbol", "name", "sector", "industry", "ipoyear", "exchange"]
-
     display_table(
         data=formatted_data,
         title=title,
@@ -139,23 +178,15 @@ def display_stock_data(
 
 
 def display_sec_company_data(
-    data: List[Dict], limit: Optional[int] = None, table_format: str = "grid"
+    data: List["SecCompany"], limit: Optional[int] = None, table_format: str = "grid"
 ) -> None:
     """Display SEC company data in a formatted table."""
     if not data:
         print("❌ Failed to load SEC company data")
         return
 
-    # Format and map data to consistent field names
-    formatted_data = []
-    for record in data:
-        # Map SEC API fields to our display fields
-        formatted_record = {
-            "cik_str": record.get("cik_str", "N/A"),
-            "ticker": record.get("ticker", "N/A"),
-            "title": record.get("title", "N/A"),
-        }
-        formatted_data.append(formatted_record)
+    # Rows as value tuples in header order
+    formatted_data = [(record.cik_str, record.ticker, record.title) for record in data]
 
     # Define column configuration for SEC data
     column_config = {
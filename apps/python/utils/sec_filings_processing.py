@@ -3,12 +3,114 @@ SEC filings processing utilities.
 Handles SEC filing download, metadata, listing items, and section content extraction.
 """
 
-from typing import List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
+from operator import attrgetter
 import argparse
 import sys
+import threading
+import time
 from config import SEC_EDGAR_IDENTITY
-from utils.display_data import display_table
-from edgar import Company, set_identity
+
+# Tickers looked up at once by get_company_filings_bulk
+MAX_FILING_WORKERS = 10
+
+# EDGAR asks clients to stay under 10 requests per second. A filing lookup
+# (company, submissions, filing index) or document parse makes several
+# requests, so each one is spaced to fit its share of that budget, across
+# all threads
+EDGAR_MAX_REQUESTS_PER_SECOND = 10
+EDGAR_REQUESTS_PER_CALL = 3
+EDGAR_MIN_CALL_INTERVAL = EDGAR_REQUESTS_PER_CALL / EDGAR_MAX_REQUESTS_PER_SECOND
+_last_edgar_call = 0.0
+_edgar_call_lock = threading.Lock()
+
+# Parsed filing documents kept in memory, keyed by accession number
+FILING_OBJ_CACHE_SIZE = 32
+_filing_obj_cache: Dict[str, Any] = {}
+
+# Characters per write when streaming filing content to stdout
+OUTPUT_SLICE_SIZE = 1 << 16
+
+# EntityFiling fields reported by extract_filing_metadata, in display order
+METADATA_FIELDS = (
+    "cik",
+    "company",
+    "form",
+    "filing_date",
+    "report_date",
+    "acceptance_datetime",
+    "accession_no",
+    "file_number",
+    "items",
+    "size",
+    "primary_document",
+    "primary_doc_description",
+    "is_xbrl",
+    "is_inline_xbrl",
+)
+_get_metadata_fields = attrgetter(*METADATA_FIELDS)
+
+
+# Interactive menu and quick help, each written to stdout in one call
+MENU_HEADER_TEXT = """\
+🏢 SEC Filing Processing - Interactive Menu
+==================================================
+
+"""
+
+MENU_OPTIONS_TEXT = """\
+📋 Available Options:
+  1. Get Company Filing
+  2. Extract Filing Metadata
+  3. Validate Filing Data
+  4. List Filing Items
+  5. Get Section Content
+  6. Quick Help
+  7. Exit
+
+"""
+
+# Menu choices that select a CLI action; 6 (help) and 7 (exit) are handled inline
+MENU_CHOICES = {
+    "1": "get_filing",
+    "2": "extract_metadata",
+    "3": "validate_data",
+    "4": "list_items",
+    "5": "get_content",
+}
+
+QUICK_HELP_TEXT = """\
+🏢 SEC Filing Processing - Quick Help
+==================================================
+
+📋 AVAILABLE FUNCTIONS:
+  --get-filing TICKER        Get latest filing for a company
+                             (TICKER may be comma-separated, e.g. AAPL,MSFT)
+  --extract-metadata TICKER  Extract filing metadata
+  --validate-data TICKER     Validate filing data (add --deep to parse the document)
+  --list-items TICKER        List filing items
+  --get-content TICKER ITEM  Get content for a specific section
+  --all TICKER               Filing, metadata, validation and items in one go
+
+⚙️  OPTIONS:
+  --form-type TYPE           Form type (default: 10-K)
+  --year YYYY                Filing year to retrieve (e.g., 2023)
+  --count NUMBER             Number of filings to retrieve
+  --limit NUMBER             Limit number of results to display
+  --format FORMAT            Table format (grid, fancy_grid, simple, etc.)
+  --metadata all             Display all EntityFiling fields in a table
+  --quiet                    Suppress output (for scripting)
+
+💡 QUICK EXAMPLES:
+  uv run python -m utils.sec_filings_processing --get-filing AAPL
+  uv run python -m utils.sec_filings_processing --get-filing AAPL --year 2022
+  uv run python -m utils.sec_filings_processing --extract-metadata GOOGL --metadata all
+  uv run python -m utils.sec_filings_processing  # Interactive menu
+
+❓ For full help: --help
+"""
 
 
 def get_company_filing(
@@ -33,29 +135,147 @@ def get_company_filing(
         Filing object or None if not found
     """
     try:
-        # Set SEC EDGAR identity for API compliance if supported by library
-        set_identity(SEC_EDGAR_IDENTITY)
+        return _fetch_filing(ticker, form_type, count, year, amendments)
+    except Exception as e:
+        print(f"Error fetching filing for {ticker}: {e}")
+        return None
 
-        company = Company(ticker)
 
-        if year is not None:
-            filings = (
-                company.get_filings(form=form_type, year=year)
-                .filter(amendments=amendments)
-                .latest(count)
-            )
-        else:
-            filings = (
-                company.get_filings(form=form_type)
-                .filter(amendments=amendments)
-                .latest(count)
-            )
+@cache
+def _ensure_identity() -> None:
+    """Set the SEC EDGAR identity for API compliance, once per process."""
+    from edgar import set_identity
+
+    set_identity(SEC_EDGAR_IDENTITY)
+
+
+def _throttle_edgar_calls() -> None:
+    """Wait only as long as needed to space EDGAR calls EDGAR_MIN_CALL_INTERVAL."""
+    global _last_edgar_call
+    with _edgar_call_lock:
+        wait = EDGAR_MIN_CALL_INTERVAL - (time.monotonic() - _last_edgar_call)
+        if wait > 0:
+            time.sleep(wait)
+        _last_edgar_call = time.monotonic()
+
+
+@lru_cache(maxsize=256)
+def _company(ticker: str) -> Any:
+    """Resolve a ticker to an edgar Company once per process."""
+    # edgar is slow to import, so it's only loaded once a filing is requested
+    from edgar import Company
+
+    return Company(ticker)
+
+
+@lru_cache(maxsize=128)
+def _fetch_filing(
+    ticker: str,
+    form_type: str,
+    count: int,
+    year: Optional[int],
+    amendments: bool,
+) -> Any:
+    """
+    Look up filings on EDGAR, memoized per process.
+
+    Failed lookups raise and are therefore not cached, so a transient error
+    doesn't stick for the rest of the session.
+    """
+    _ensure_identity()
+    _throttle_edgar_calls()
+
+    company = _company(ticker)
+
+    if year is not None:
+        filings = (
+            company.get_filings(form=form_type, year=year)
+            .filter(amendments=amendments)
+            .latest(count)
+        )
+    else:
+        filings = (
+            company.get_filings(form=form_type)
+            .filter(amendments=amendments)
+            .latest(count)
+        )
+
+    return filings
+
+
+def _filing_obj(filing: Any) -> Any:
+    """
+    Return filing.obj(), parsing each filing at most once per process.
+
+    Parsed objects are keyed by accession number; the oldest entry is evicted
+    once FILING_OBJ_CACHE_SIZE filings are held.
+    """
+    accession_no = getattr(filing, "accession_no", None)
+    if accession_no is None:
+        _throttle_edgar_calls()
+        return filing.obj()
+
+    # Membership, not .get(), so a filing that parses to None is a hit too
+    if accession_no in _filing_obj_cache:
+        return _filing_obj_cache[accession_no]
+
+    _throttle_edgar_calls()
+    filing_obj = filing.obj()
+    if len(_filing_obj_cache) >= FILING_OBJ_CACHE_SIZE:
+        _filing_obj_cache.pop(next(iter(_filing_obj_cache)))
+    _filing_obj_cache[accession_no] = filing_obj
+    return filing_obj
 
-        return filings
 
+def get_company_filings_bulk(
+    tickers: List[str],
+    form_type: str = "10-K",
+    count: int = 1,
+    year: Optional[int] = None,
+    amendments: bool = False,
+    max_workers: int = MAX_FILING_WORKERS,
+) -> Dict[str, Optional[Any]]:
+    """
+    Get filings for several companies concurrently.
+
+    EDGAR lookups are network-bound, so tickers are fetched on a small thread
+    pool instead of one after another; every lookup still goes through the
+    shared EDGAR rate limit.
+
+    Args:
+        tickers: Stock ticker symbols
+        form_type: Type of SEC form (default: "10-K")
+        count: Number of latest filings to retrieve (used when year is not specified)
+        year: Specific filing year to fetch
+        amendments: Whether to include amendments
+        max_workers: Maximum number of tickers looked up at once
+
+    Returns:
+        Dictionary of {ticker: filing or None}, in the order tickers were given
+    """
+    if len(tickers) <= 1:
+        return {
+            ticker: get_company_filing(ticker, form_type, count, year, amendments)
+            for ticker in tickers
+        }
+
+    # Set the identity before fanning out so worker threads don't race on it;
+    # a failure is reported per ticker, like any other failed lookup
+    try:
+        _ensure_identity()
     except Exception as e:
-        print(f"Error fetching filing for {ticker}: {e}")
-        return None
+        for ticker in tickers:
+            print(f"Error fetching filing for {ticker}: {e}")
+        return dict.fromkeys(tickers)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as executor:
+        futures = [
+            executor.submit(
+                get_company_filing, ticker, form_type, count, year, amendments
+            )
+            for ticker in tickers
+        ]
+        return {ticker: future.result() for ticker, future in zip(tickers, futures)}
 
 
 def extract_filing_metadata(filing: Any) -> dict:
@@ -70,35 +290,52 @@ def extract_filing_metadata(filing: Any) -> dict:
     """
     try:
         # Use EntityFiling properties only (no legacy fallbacks)
-        metadata = {
-            "cik": getattr(filing, "cik", None),
-            "company": getattr(filing, "company", None),
-            "form": getattr(filing, "form", None),
-            "filing_date": getattr(filing, "filing_date", None),
-            "report_date": getattr(filing, "report_date", None),
-            "acceptance_datetime": getattr(filing, "acceptance_datetime", None),
-            "accession_no": getattr(filing, "accession_no", None),
-            "file_number": getattr(filing, "file_number", None),
-            "items": getattr(filing, "items", []),
-            "size": getattr(filing, "size", None),
-            "primary_document": getattr(filing, "primary_document", None),
-            "primary_doc_description": getattr(filing, "primary_doc_description", None),
-            "is_xbrl": getattr(filing, "is_xbrl", None),
-            "is_inline_xbrl": getattr(filing, "is_inline_xbrl", None),
-        }
+        try:
+            values = _get_metadata_fields(filing)
+        except AttributeError:
+            # Some fields are missing: fall back to per-field lookups
+            values = tuple(
+                getattr(filing, field, [] if field == "items" else None)
+                for field in METADATA_FIELDS
+            )
 
-        return metadata
+        return dict(zip(METADATA_FIELDS, values))
     except Exception as e:
         print(f"Error extracting filing metadata: {e}")
         return {}
 
 
-def validate_filing_data(filing: Any) -> bool:
+def get_parsed_filing(filing: Any) -> Optional[Any]:
+    """
+    Parse a SEC filing into its form-specific object (e.g. TenK).
+
+    Parsing downloads and parses the primary document, so callers should do it
+    once and pass the result to get_filing_items and get_filing_content.
+
+    Args:
+        filing: SEC filing object
+
+    Returns:
+        Parsed filing object or None if parsing failed
+    """
+    try:
+        return _filing_obj(filing)
+    except Exception as e:
+        print(f"Error parsing filing: {e}")
+        return None
+
+
+def validate_filing_data(filing: Any, deep: bool = False) -> bool:
     """
     Validate that a filing object has the required data.
 
+    The default check only looks at fields already on the filing, so it needs
+    no download. With deep=True the filing is also parsed (see
+    get_parsed_filing) and must expose at least one item.
+
     Args:
         filing: SEC filing object
+        deep: Whether to parse the filing and check its items
 
     Returns:
         True if filing is valid, False otherwise
@@ -107,9 +344,15 @@ def validate_filing_data(filing: Any) -> bool:
         if not filing:
             return False
 
-        filing_obj = filing.obj()
-        if not hasattr(filing_obj, "items") or not filing_obj.items:
+        if not getattr(filing, "accession_no", None):
             return False
+        if not getattr(filing, "primary_document", None):
+            return False
+
+        if deep:
+            parsed_filing = get_parsed_filing(filing)
+            if not hasattr(parsed_filing, "items") or not parsed_filing.items:
+                return False
 
         return True
     except Exception as e:
@@ -117,90 +360,92 @@ def validate_filing_data(filing: Any) -> bool:
         return False
 
 
-def get_filing_items(filing: Any) -> List[str]:
+def get_filing_items(parsed_filing: Any) -> List[str]:
     """
-    Get list of filing items from a SEC filing.
+    Get list of filing items from a parsed SEC filing.
 
     Args:
-        filing: SEC filing object
+        parsed_filing: Parsed filing object from get_parsed_filing
 
     Returns:
         List of filing item names
     """
+    if parsed_filing is None:
+        return []
+
     try:
-        return filing.obj().items
+        return parsed_filing.items
     except Exception as e:
         print(f"Error getting filing items: {e}")
         return []
 
 
-def get_filing_content(filing: Any, item: str) -> Optional[str]:
+def get_filing_content(parsed_filing: Any, item: str) -> Optional[str]:
     """
     Get content for a specific filing item.
 
     Args:
-        filing: SEC filing object
+        parsed_filing: Parsed filing object from get_parsed_filing
         item: Name of the filing item
 
     Returns:
         Content string or None if not found
     """
+    if parsed_filing is None:
+        return None
+
     try:
-        item_content = filing.obj()[item]
+        item_content = parsed_filing[item]
         return item_content
     except Exception as e:
         print(f"Error getting filing content for item {item}: {e}")
         return None
 
 
+def get_filing_content_preview(
+    parsed_filing: Any, item: str, max_chars: int
+) -> Tuple[Optional[str], int]:
+    """
+    Get the beginning of a filing item's content.
+
+    Only the preview is returned, so the caller doesn't keep the full section
+    text alive while it is displayed.
+
+    Args:
+        parsed_filing: Parsed filing object from get_parsed_filing
+        item: Name of the filing item
+        max_chars: Maximum number of characters to return
+
+    Returns:
+        Tuple of (preview or None if not found, full content length)
+    """
+    content = get_filing_content(parsed_filing, item)
+    if not content:
+        return None, 0
+
+    return content[:max_chars], len(content)
+
+
 def show_interactive_menu():
     """Show interactive menu for SEC filing processing options."""
-    print("🏢 SEC Filing Processing - Interactive Menu")
-    print("=" * 50)
-    print()
-    print("📋 Available Options:")
-    print("  1. Get Company Filing")
-    print("  2. Extract Filing Metadata")
-    print("  3. Validate Filing Data")
-    print("  4. List Filing Items")
-    print("  5. Get Section Content")
-    print("  6. Quick Help")
-    print("  7. Exit")
-    print()
+    sys.stdout.write(MENU_HEADER_TEXT + MENU_OPTIONS_TEXT)
 
     while True:
         try:
-            choice = input("Enter your choice (1-8): ").strip()
-
-            if choice == "1":
-                return "get_filing"
-            elif choice == "2":
-                return "extract_metadata"
-            elif choice == "3":
-                return "validate_data"
-            elif choice == "4":
-                return "list_items"
-            elif choice == "5":
-                return "get_content"
-            elif choice == "6":
+            choice = input("Enter your choice (1-7): ").strip()
+
+            action = MENU_CHOICES.get(choice)
+            if action:
+                return action
+
+            if choice == "6":
                 show_quick_help()
-                print("\n" + "=" * 50)
-                print("📋 Available Options:")
-                print("  1. Get Company Filing")
-                print("  2. Extract Filing Metadata")
-                print("  3. Validate Filing Data")
-                print("  4. List Filing Items")
-                print("  5. Get Section Content")
-                print("  6. Quick Help")
-                print("  7. Exit")
-                print()
-                continue
+                sys.stdout.write("\n" + "=" * 50 + "\n" + MENU_OPTIONS_TEXT)
             elif choice == "7":
                 print("👋 Goodbye!")
                 sys.exit(0)
             else:
                 print("❌ Invalid choice. Please enter 1-7.")
-                continue
 
         except KeyboardInterrupt:
             print("\n👋 Goodbye!")
@@ -212,36 +457,201 @@ def show_interactive_menu():
 
 def show_quick_help():
     """Show quick help with common options."""
-    print("🏢 SEC Filing Processing - Quick Help")
-    print("=" * 50)
-    print()
-    print("📋 AVAILABLE FUNCTIONS:")
-    print("  --get-filing TICKER        Get latest filing for a company")
-    print("  --extract-metadata TICKER  Extract filing metadata")
-    print("  --validate-data TICKER     Validate filing data")
-    print("  --list-items TICKER        List filing items")
-    print("  --get-content TICKER ITEM  Get content for a specific section")
-    print()
-    print("⚙️  OPTIONS:")
-    print("  --form-type TYPE           Form type (default: 10-K)")
-    print("  --year YYYY                Filing year to retrieve (e.g., 2023)")
-    print("  --count NUMBER             Number of filings to retrieve")
-    print("  --limit NUMBER             Limit number of results to display")
-    print("  --format FORMAT            Table format (grid, fancy_grid, simple, etc.)")
-    print("  --metadata all             Display all EntityFiling fields in a table")
-    print("  --quiet                    Suppress output (for scripting)")
-    print()
-    print("💡 QUICK EXAMPLES:")
-    print("  uv run python -m utils.sec_filings_processing --get-filing AAPL")
-    print(
-        "  uv run python -m utils.sec_filings_processing --get-filing AAPL --year 2022"
+    sys.stdout.write(QUICK_HELP_TEXT)
+
+
+def _write_text(text: str, slice_size: int = OUTPUT_SLICE_SIZE) -> None:
+    """Write a large text to stdout in slices, followed by a newline."""
+    write = sys.stdout.write
+    for start in range(0, len(text), slice_size):
+        write(text[start : start + slice_size])
+    write("\n")
+    sys.stdout.flush()
+
+
+def _get_filings_for_tickers(
+    ticker_arg: str, args: argparse.Namespace
+) -> Dict[str, Any]:
+    """Fetch filings for a comma-separated ticker argument using the CLI options."""
+    tickers = [ticker.strip() for ticker in ticker_arg.split(",") if ticker.strip()]
+    return get_company_filings_bulk(tickers, args.form_type, args.count, args.year)
+
+
+def _for_each_filing(
+    ticker_arg: str, args: argparse.Namespace, report: Callable[[str, Any], None]
+) -> None:
+    """Fetch filings for the tickers and report each one, or its fetch failure."""
+    for ticker, filing in _get_filings_for_tickers(ticker_arg, args).items():
+        if filing:
+            report(ticker, filing)
+        else:
+            print(f"❌ Failed to retrieve filing for {ticker}")
+
+
+def _report_filing(ticker: str, filing: Any, args: argparse.Namespace) -> None:
+    if not args.quiet:
+        print(f"✅ Successfully retrieved filing for {ticker}")
+        metadata = extract_filing_metadata(filing)
+        if metadata:
+            print(f"📅 Filing Date: {metadata.get('filing_date', 'N/A')}")
+            print(f"📋 Form Type: {metadata.get('form', 'N/A')}")
+            print(f"🔢 Accession Number: {metadata.get('accession_no', 'N/A')}")
+
+
+def _report_metadata(ticker: str, filing: Any, args: argparse.Namespace) -> None:
+    metadata = extract_filing_metadata(filing)
+    if metadata:
+        if not args.quiet:
+            # Imported here so --quick-help and the menu don't pay for pandas/tabulate
+            from utils.display_data import display_table
+
+            print(f"✅ Successfully extracted metadata for {ticker}")
+            # Display all metadata directly from extract_filing_metadata output
+            metadata_list = [(field, str(value)) for field, value in metadata.items()]
+            display_table(
+                data=metadata_list,
+                title=f"📋 Filing Metadata for {ticker}",
+                headers=["Field", "Value"],
+                limit=args.limit,
+                table_format=args.format,
+            )
+    else:
+        print(f"❌ Failed to extract metadata for {ticker}")
+
+
+def _report_validation(ticker: str, filing: Any, args: argparse.Namespace) -> None:
+    if validate_filing_data(filing, deep=args.deep):
+        print(f"✅ Filing data is valid for {ticker}")
+    else:
+        print(f"❌ Filing data is invalid for {ticker}")
+
+
+def _report_items(ticker: str, parsed_filing: Any, args: argparse.Namespace) -> None:
+    items = get_filing_items(parsed_filing)
+    if items:
+        if not args.quiet:
+            from utils.display_data import display_table
+
+            print(f"✅ Found {len(items)} filing items for {ticker}")
+            # Display items in table format
+            items_list = [(i + 1, item) for i, item in enumerate(items)]
+            display_table(
+                data=items_list,
+                title=f"📋 Filing Items for {ticker}",
+                headers=["Index", "Item"],
+                limit=args.limit,
+                table_format=args.format,
+            )
+    else:
+        print(f"❌ No filing items found for {ticker}")
+
+
+def _report_content(
+    ticker: str, parsed_filing: Any, item: str, args: argparse.Namespace
+) -> None:
+    if args.limit:
+        # Rough character limit: 100 characters per --limit unit
+        content, content_length = get_filing_content_preview(
+            parsed_filing, item, args.limit * 100
+        )
+    else:
+        content = get_filing_content(parsed_filing, item)
+        content_length = len(content) if content else 0
+
+    if content:
+        if not args.quiet:
+            print(f"✅ Successfully retrieved content for {item} in {ticker}")
+            print(f"📊 Content length: {content_length} characters")
+            if args.limit:
+                print(f"📝 Content preview:\n{content}...")
+            else:
+                print("📝 Content:")
+                _write_text(content)
+    else:
+        print(f"❌ Failed to retrieve content for {item} in {ticker}")
+
+
+def _cmd_get_filing(args: argparse.Namespace) -> None:
+    if not args.quiet:
+        print(f"🔍 Getting {args.form_type} filing for {args.get_filing}...")
+
+    _for_each_filing(
+        args.get_filing,
+        args,
+        lambda ticker, filing: _report_filing(ticker, filing, args),
     )
-    print(
-        "  uv run python -m utils.sec_filings_processing --extract-metadata GOOGL --metadata all"
+
+
+def _cmd_extract_metadata(args: argparse.Namespace) -> None:
+    if not args.quiet:
+        print(f"📋 Extracting metadata for {args.extract_metadata}...")
+
+    _for_each_filing(
+        args.extract_metadata,
+        args,
+        lambda ticker, filing: _report_metadata(ticker, filing, args),
     )
-    print("  uv run python -m utils.sec_filings_processing  # Interactive menu")
-    print()
-    print("❓ For full help: --help")
+
+
+def _cmd_validate_data(args: argparse.Namespace) -> None:
+    if not args.quiet:
+        print(f"✅ Validating filing data for {args.validate_data}...")
+
+    _for_each_filing(
+        args.validate_data,
+        args,
+        lambda ticker, filing: _report_validation(ticker, filing, args),
+    )
+
+
+def _cmd_list_items(args: argparse.Namespace) -> None:
+    if not args.quiet:
+        print(f"📋 Listing filing items for {args.list_items}...")
+
+    _for_each_filing(
+        args.list_items,
+        args,
+        lambda ticker, filing: _report_items(ticker, get_parsed_filing(filing), args),
+    )
+
+
+def _cmd_get_content(args: argparse.Namespace) -> None:
+    tickers, item = args.get_content
+    if not args.quiet:
+        print(f"📄 Getting content for {item} in {tickers} filing...")
+
+    _for_each_filing(
+        tickers,
+        args,
+        lambda ticker, filing: _report_content(
+            ticker, get_parsed_filing(filing), item, args
+        ),
+    )
+
+
+def _cmd_all(args: argparse.Namespace) -> None:
+    """Report filing, metadata, validation and items from one fetch and one parse."""
+    if not args.quiet:
+        print(f"🔍 Getting {args.form_type} filing for {args.all}...")
+
+    def report(ticker: str, filing: Any) -> None:
+        _report_filing(ticker, filing, args)
+        _report_metadata(ticker, filing, args)
+        _report_validation(ticker, filing, args)
+        _report_items(ticker, get_parsed_filing(filing), args)
+
+    _for_each_filing(args.all, args, report)
+
+
+# CLI actions by argparse dest, checked in order; the first one given runs
+COMMANDS: Dict[str, Callable[[argparse.Namespace], None]] = {
+    "get_filing": _cmd_get_filing,
+    "extract_metadata": _cmd_extract_metadata,
+    "validate_data": _cmd_validate_data,
+    "list_items": _cmd_list_items,
+    "get_content": _cmd_get_content,
+    "all": _cmd_all,
+}
 
 
 def main():
@@ -260,7 +670,9 @@ Examples:
 
     # Main function options
     parser.add_argument(
-        "--get-filing", metavar="TICKER", help="Get latest filing for a company"
+        "--get-filing",
+        metavar="TICKER",
+        help="Get latest filing for a company (comma-separate several tickers)",
     )
     parser.add_argument(
         "--extract-metadata", metavar="TICKER", help="Extract filing metadata"
@@ -273,6 +685,11 @@ Examples:
     parser.add_argument(
         "--validate-data", metavar="TICKER", help="Validate filing data"
     )
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="Parse the filing document when validating (slower)",
+    )
     parser.add_argument("--list-items", metavar="TICKER", help="List filing items")
     parser.add_argument(
         "--get-content",
@@ -280,6 +697,11 @@ Examples:
         metavar=("TICKER", "ITEM"),
         help="Get content for specific filing item",
     )
+    parser.add_argument(
+        "--all",
+        metavar="TICKER",
+        help="Get filing, metadata, validation and items from a single fetch",
+    )
 
     # Common options
     parser.add_argument("--form-type", default="10-K", help="Form type (default: 10-K)")
@@ -314,154 +736,19 @@ Examples:
     # If no arguments provided, show interactive menu
     if len(sys.argv) == 1:
         selected_option = show_interactive_menu()
-        # Set the appropriate argument based on user selection
-        if selected_option == "get_filing":
-            ticker = input("Enter ticker symbol: ").strip()
-            args.get_filing = ticker
-        elif selected_option == "extract_metadata":
-            ticker = input("Enter ticker symbol: ").strip()
-            args.extract_metadata = ticker
-        elif selected_option == "validate_data":
-            ticker = input("Enter ticker symbol: ").strip()
-            args.validate_data = ticker
-        elif selected_option == "list_items":
-            ticker = input("Enter ticker symbol: ").strip()
-            args.list_items = ticker
-        elif selected_option == "get_content":
-            ticker = input("Enter ticker symbol: ").strip()
+        # Menu actions are named after the argparse dest they fill in
+        ticker = input("Enter ticker symbol: ").strip()
+        if selected_option == "get_content":
             item = input("Enter filing item: ").strip()
             args.get_content = [ticker, item]
+        else:
+            setattr(args, selected_option, ticker)
 
     try:
-        # Handle get filing
-        if args.get_filing:
-            if not args.quiet:
-                print(f"🔍 Getting {args.form_type} filing for {args.get_filing}...")
-
-            filing = get_company_filing(
-                args.get_filing, args.form_type, args.count, args.year
-            )
-            if filing:
-                if not args.quiet:
-                    print(f"✅ Successfully retrieved filing for {args.get_filing}")
-                    metadata = extract_filing_metadata(filing)
-                    if metadata:
-                        print(f"📅 Filing Date: {metadata.get('filing_date', 'N/A')}")
-                        print(f"📋 Form Type: {metadata.get('form', 'N/A')}")
-                        print(
-                            f"🔢 Accession Number: {metadata.get('accession_no', 'N/A')}"
-                        )
-            else:
-                print(f"❌ Failed to retrieve filing for {args.get_filing}")
-
-        # Handle extract metadata
-        elif args.extract_metadata:
-            if not args.quiet:
-                print(f"📋 Extracting metadata for {args.extract_metadata}...")
-
-            filing = get_company_filing(
-                args.extract_metadata, args.form_type, args.count, args.year
-            )
-            if filing:
-                metadata = extract_filing_metadata(filing)
-                if metadata:
-                    if not args.quiet:
-                        print(
-                            f"✅ Successfully extracted metadata for {args.extract_metadata}"
-                        )
-                        # Display all metadata directly from extract_filing_metadata output
-                        metadata_list = [
-                            {"Field": k, "Value": str(v)} for k, v in metadata.items()
-                        ]
-                        display_table(
-                            data=metadata_list,
-                            title=f"📋 Filing Metadata for {args.extract_metadata}",
-                            headers=["Field", "Value"],
-                            limit=args.limit,
-                            table_format=args.format,
-                        )
-                else:
-                    print(f"❌ Failed to extract metadata for {args.extract_metadata}")
-            else:
-                print(f"❌ Failed to retrieve filing for {args.extract_metadata}")
-
-        # Handle validate data
-        elif args.validate_data:
-            if not args.quiet:
-                print(f"✅ Validating filing data for {args.validate_data}...")
-
-            filing = get_company_filing(
-                args.validate_data, args.form_type, args.count, args.year
-            )
-            if filing:
-                is_valid = validate_filing_data(filing)
-                if is_valid:
-                    print(f"✅ Filing data is valid for {args.validate_data}")
-                else:
-                    print(f"❌ Filing data is invalid for {args.validate_data}")
-            else:
-                print(f"❌ Failed to retrieve filing for {args.validate_data}")
-
-        # Handle list items
-        elif args.list_items:
-            if not args.quiet:
-                print(f"📋 Listing filing items for {args.list_items}...")
-
-            filing = get_company_filing(
-                args.list_items, args.form_type, args.count, args.year
-            )
-            if filing:
-                items = get_filing_items(filing)
-                if items:
-                    if not args.quiet:
-                        print(
-                            f"✅ Found {len(items)} filing items for {args.list_items}"
-                        )
-                        # Display items in table format
-                        items_list = [
-                            {"Item": item, "Index": i + 1}
-                            for i, item in enumerate(items)
-                        ]
-                        display_table(
-                            data=items_list,
-                            title=f"📋 Filing Items for {args.list_items}",
-                            headers=["Index", "Item"],
-                            limit=args.limit,
-                            table_format=args.format,
-                        )
-                else:
-                    print(f"❌ No filing items found for {args.list_items}")
-            else:
-                print(f"❌ Failed to retrieve filing for {args.list_items}")
-
-        # Handle get content
-        elif args.get_content:
-            ticker, item = args.get_content
-            if not args.quiet:
-                print(f"📄 Getting content for {item} in {ticker} filing...")
-
-            filing = get_company_filing(ticker, args.form_type, args.count, args.year)
-            if filing:
-                content = get_filing_content(filing, item)
-                if content:
-                    if not args.quiet:
-                        print(
-                            f"✅ Successfully retrieved content for {item} in {ticker}"
-                        )
-                        print(f"📊 Content length: {len(content)} characters")
-                        if args.limit:
-                            # Show first N characters
-                            preview = content[
-                                : args.limit * 100
-                            ]  # Rough character limit
-                            print(f"📝 Content preview:\n{preview}...")
-                        else:
-                            print(f"📝 Content:\n{content}")
-                else:
-                    print(f"❌ Failed to retrieve content for {item} in {ticker}")
-            else:
-                print(f"❌ Failed to retrieve filing for {ticker}")
-
+        for dest, command in COMMANDS.items():
+            if getattr(args, dest):
+                command(args)
+                break
         else:
             print("❌ Please specify a function to run")
             parser.print_help()
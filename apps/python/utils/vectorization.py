@@ -4,18 +4,24 @@ Handles chunking, overlapping, embedding generation, and vector storage.
 """
 
 import argparse
+import os
 import re
+import sys
 import numpy as np
-from typing import List, Dict, Optional, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, repeat
+from typing import List, Dict, Callable, Iterable, Iterator, Optional, Tuple, Any, Union
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import hashlib
 import json
 import logging
 import openai
 from sentence_transformers import SentenceTransformer
+from config import CACHE_DIR
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -58,10 +64,26 @@ DEFAULT_OVERLAP_SIZE = 200
 DEFAULT_MIN_CHUNK_SIZE = 100
 DEFAULT_MAX_CHUNK_SIZE = 2000
 DEFAULT_BATCH_SIZE = 32
+# Cap on the Sentence Transformers batch size picked from free CUDA memory
+MAX_AUTO_BATCH_SIZE = 256
+
+# Upper bound on concurrent OpenAI embedding requests, and how often the client
+# retries a rate-limited or failed request (with exponential backoff)
+MAX_EMBEDDING_WORKERS = 8
+OPENAI_MAX_RETRIES = 5
 DEFAULT_EMBEDDING_MODEL = EmbeddingModel.SENTENCE_TRANSFORMERS_ALL_MINI
 
-# Optimal chunking configurations per section type
-SECTION_CHUNK_CONFIGS = {
+# Output dimensions of the OpenAI embedding models
+_OPENAI_EMBEDDING_DIMS = MappingProxyType(
+    {
+        EmbeddingModel.OPENAI_ADA_002: 1536,
+        EmbeddingModel.OPENAI_3_SMALL: 1536,
+        EmbeddingModel.OPENAI_3_LARGE: 3072,
+    }
+)
+
+# Optimal chunking configurations per section type (read-only)
+_SECTION_CHUNK_CONFIGS = {
     SectionType.FINANCIAL_STATEMENTS: {
         "chunk_size": 800,
         "overlap": 100,
@@ -98,6 +120,47 @@ SECTION_CHUNK_CONFIGS = {
         "description": "Other sections - default configuration",
     },
 }
+SECTION_CHUNK_CONFIGS = MappingProxyType(
+    {
+        section_type: MappingProxyType(config)
+        for section_type, config in _SECTION_CHUNK_CONFIGS.items()
+    }
+)
+
+# (chunk_size, overlap) per section type, unpacked once at import
+_SECTION_CHUNK_PARAMS = MappingProxyType(
+    {
+        section_type: (config["chunk_size"], config["overlap"])
+        for section_type, config in SECTION_CHUNK_CONFIGS.items()
+    }
+)
+
+
+# Section header lines, one alternative per common form; compiled once and
+# fused so each line is matched in a single pass. Anchored per-line match()
+# calls beat a MULTILINE finditer over the whole text, which has to try the
+# pattern at every character
+_SECTION_HEADER_PATTERN = re.compile(
+    r"Item\s+\d+[A-Z]?\s*[:\-]"  # Item 1:, Item 1A:, etc.
+    r"|Section\s+\d+[A-Z]?\s*[:\-]"  # Section 1:, etc.
+    r"|Part\s+[IVX]+[A-Z]?\s*[:\-]"  # Part I:, Part II:, etc.
+    r"|\d+\.\s+[A-Z]",  # 1. Title, 2. Title, etc.
+    re.IGNORECASE,
+)
+
+# Blank lines between paragraphs; a run of them is a single break, and
+# Windows line endings count too. Starting on a literal "\n" (any "\r" before
+# it is stripped with the paragraph) lets the regex engine skip ahead to
+# candidate positions, where "(?:\r?\n){2,}" is tried at every character
+_PARAGRAPH_SEPARATOR = re.compile(r"\n(?:\r?\n)+")
+
+# Simple sentence splitting - can be improved with more sophisticated NLP
+_SENTENCE_END_PATTERN = re.compile(r"[.!?]+")
+
+
+def get_optimal_chunk_config(section_type: SectionType) -> Tuple[int, int]:
+    """Return the (chunk_size, overlap) tuned for a section type."""
+    return _SECTION_CHUNK_PARAMS[section_type]
 
 
 def chunk_text(
@@ -164,44 +227,14 @@ def _chunk_fixed_size(
     metadata: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
     """Chunk text into fixed-size chunks with overlap."""
-    chunks = []
-    start = 0
-    chunk_id = 0
-
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
-
-        # Adjust end to preserve sentence boundaries
-        if end < len(text):
-            end = _find_sentence_boundary(text, start, end)
-
-        chunk_text = text[start:end].strip()
-
-        if len(chunk_text) >= min_chunk_size:
-            chunk = {
-                "text": chunk_text,
-                "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_id}",
-                "start_pos": start,
-                "end_pos": end,
-                "metadata": {
-                    **metadata,
-                    "chunk_index": chunk_id,
-                    "total_chunks": None,  # Will be set later
-                },
-            }
-            chunks.append(chunk)
-            chunk_id += 1
-
-        # Move start position with overlap
-        start = end - overlap_size
-        if start >= end:  # Prevent infinite loop
-            start = end
-
-    # Update total_chunks for all chunks
-    for chunk in chunks:
-        chunk["metadata"]["total_chunks"] = len(chunks)
-
-    return chunks
+    # Same windows as the sliding-window chunker: all offsets are planned up
+    # front and each kept window is sliced once, already trimmed
+    windows = _sliding_window_offsets(text, chunk_size, overlap_size, min_chunk_size)
+    pieces = [
+        (text[lo:hi], start, end, chunk_index, {})
+        for chunk_index, (lo, hi, start, end) in enumerate(windows)
+    ]
+    return _build_chunks(pieces, metadata)
 
 
 def _chunk_by_sentences(
@@ -212,172 +245,193 @@ def _chunk_by_sentences(
     max_chunk_size: int,
     metadata: Dict[str, Any],
 ) -> List[Dict[str, Any]]:
-    """Chunk text by sentences, respecting size limits."""
-    sentences = _split_into_sentences(text)
-    chunks = []
-    current_chunk = []
+    """
+    Chunk text by sentences, respecting size limits.
+
+    Sentences are tracked as (start, end) spans, so each chunk is a single
+    slice of text running from its first sentence to its last.
+    """
+    pieces = []
+    # (start, end) offsets in text of each sentence in the current chunk
+    current_spans = []
     current_size = 0
-    chunk_id = 0
 
-    for sentence in sentences:
-        sentence_size = len(sentence)
+    for span in _sentence_span_table(text):
+        sentence_size = span[1] - span[0]
 
         # If adding this sentence would exceed max size, finalize current chunk
         if (
             current_size + sentence_size > max_chunk_size
-            and current_chunk
+            and current_spans
             and current_size >= min_chunk_size
         ):
-            chunk_text = " ".join(current_chunk)
-            start_pos = text.find(chunk_text)
-            end_pos = start_pos + len(chunk_text)
-
-            chunk = {
-                "text": chunk_text,
-                "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_id}",
-                "start_pos": start_pos,
-                "end_pos": end_pos,
-                "metadata": {
-                    **metadata,
-                    "chunk_index": chunk_id,
-                    "sentence_count": len(current_chunk),
-                },
-            }
-            chunks.append(chunk)
+            start_pos, end_pos = current_spans[0][0], current_spans[-1][1]
+            pieces.append(
+                (
+                    text[start_pos:end_pos],
+                    start_pos,
+                    end_pos,
+                    len(pieces),
+                    {"sentence_count": len(current_spans)},
+                )
+            )
 
             # Start new chunk with overlap
-            overlap_sentences = _get_overlap_sentences(current_chunk, overlap_size)
-            current_chunk = overlap_sentences + [sentence]
-            current_size = sum(len(s) for s in current_chunk)
-            chunk_id += 1
+            current_spans = _get_overlap_spans(current_spans, overlap_size)
+            current_spans.append(span)
+            current_size = sum(end - start for start, end in current_spans)
         else:
-            current_chunk.append(sentence)
+            current_spans.append(span)
             current_size += sentence_size
 
     # Add final chunk if it meets minimum size
-    if current_chunk and current_size >= min_chunk_size:
-        chunk_text = " ".join(current_chunk)
-        start_pos = text.find(chunk_text)
-        end_pos = start_pos + len(chunk_text)
-
-        chunk = {
-            "text": chunk_text,
-            "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_id}",
-            "start_pos": start_pos,
-            "end_pos": end_pos,
-            "metadata": {
-                **metadata,
-                "chunk_index": chunk_id,
-                "sentence_count": len(current_chunk),
-            },
-        }
-        chunks.append(chunk)
-
-    # Update total_chunks for all chunks
-    for chunk in chunks:
-        chunk["metadata"]["total_chunks"] = len(chunks)
+    if current_spans and current_size >= min_chunk_size:
+        start_pos, end_pos = current_spans[0][0], current_spans[-1][1]
+        pieces.append(
+            (
+                text[start_pos:end_pos],
+                start_pos,
+                end_pos,
+                len(pieces),
+                {"sentence_count": len(current_spans)},
+            )
+        )
 
-    return chunks
+    return _build_chunks(pieces, metadata)
 
 
 def _chunk_by_paragraphs(
     text: str, min_chunk_size: int, metadata: Dict[str, Any]
 ) -> List[Dict[str, Any]]:
     """Chunk text by paragraphs."""
-    paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
-    chunks = []
-    chunk_id = 0
-
-    for i, paragraph in enumerate(paragraphs):
+    # Walk the separator matches once, slicing each paragraph by its span
+    # instead of searching for it
+    paragraphs = []
+    offset = 0
+    for separator in chain(_PARAGRAPH_SEPARATOR.finditer(text), (None,)):
+        stop = separator.start() if separator else len(text)
+        raw = text[offset:stop]
+        paragraph = raw.strip()
+        if paragraph:
+            start_pos = offset + len(raw) - len(raw.lstrip())
+            paragraphs.append((paragraph, start_pos, start_pos + len(paragraph)))
+        if separator:
+            offset = separator.end()
+
+    pieces = []
+    for i, (paragraph, start_pos, end_pos) in enumerate(paragraphs):
         if len(paragraph) >= min_chunk_size:
-            start_pos = text.find(paragraph)
-            end_pos = start_pos + len(paragraph)
-
-            chunk = {
-                "text": paragraph,
-                "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_id}",
-                "start_pos": start_pos,
-                "end_pos": end_pos,
-                "metadata": {
-                    **metadata,
-                    "chunk_index": chunk_id,
-                    "paragraph_index": i,
-                },
-            }
-            chunks.append(chunk)
-            chunk_id += 1
-
-    # Update total_chunks for all chunks
-    for chunk in chunks:
-        chunk["metadata"]["total_chunks"] = len(chunks)
+            pieces.append(
+                (paragraph, start_pos, end_pos, len(pieces), {"paragraph_index": i})
+            )
 
-    return chunks
+    return _build_chunks(pieces, metadata)
 
 
 def _chunk_by_sections(
     text: str, min_chunk_size: int, metadata: Dict[str, Any]
 ) -> List[Dict[str, Any]]:
     """Chunk text by sections (e.g., Item 1, Item 2, etc.)."""
-    # Look for common section patterns
-    section_patterns = [
-        r"Item\s+\d+[A-Z]?\s*[:\-]",  # Item 1:, Item 1A:, etc.
-        r"Section\s+\d+[A-Z]?\s*[:\-]",  # Section 1:, etc.
-        r"Part\s+[IVX]+[A-Z]?\s*[:\-]",  # Part I:, Part II:, etc.
-        r"^\d+\.\s+[A-Z]",  # 1. Title, 2. Title, etc.
-    ]
-
+    is_header = _SECTION_HEADER_PATTERN.match
     sections = []
     current_section = ""
     current_title = ""
-
-    lines = text.split("\n")
-    for line in lines:
-        line = line.strip()
+    # Offsets in text of the current section's first and last non-blank lines
+    section_start = section_end = 0
+
+    offset = 0
+    for raw_line in text.split("\n"):
+        line_start = offset
+        offset += len(raw_line) + 1
+        line = raw_line.strip()
         if not line:
             continue
 
+        line_start += len(raw_line) - len(raw_line.lstrip())
+        line_end = line_start + len(line)
+
         # Check if this line starts a new section
-        is_section_header = any(
-            re.match(pattern, line, re.IGNORECASE) for pattern in section_patterns
-        )
+        is_section_header = is_header(line) is not None
 
         if is_section_header and current_section:
-            sections.append((current_title, current_section.strip()))
+            sections.append(
+                (current_title, current_section.strip(), section_start, section_end)
+            )
             current_section = line + "\n"
             current_title = line
+            section_start = line_start
         else:
+            if not current_section:
+                section_start = line_start
             current_section += line + "\n"
             if not current_title and line:
                 current_title = line[:50] + "..." if len(line) > 50 else line
+        section_end = line_end
 
     # Add the last section
     if current_section.strip():
-        sections.append((current_title, current_section.strip()))
+        sections.append(
+            (current_title, current_section.strip(), section_start, section_end)
+        )
+
+    # Chunks are numbered by section, so skipped short sections leave gaps
+    pieces = [
+        (
+            content,
+            start_pos,
+            end_pos,
+            i,
+            {
+                "section_title": title,
+                "section_type": "item" if "Item" in title else "section",
+            },
+        )
+        for i, (title, content, start_pos, end_pos) in enumerate(sections)
+        if len(content) >= min_chunk_size
+    ]
+
+    return _build_chunks(pieces, metadata)
+
+
+def _build_chunks(
+    pieces: List[Tuple[str, int, int, int, Dict[str, Any]]],
+    metadata: Dict[str, Any],
+) -> List[Dict[str, Any]]:
+    """
+    Build chunk dictionaries from (text, start_pos, end_pos, chunk_index,
+    extra_metadata) pieces.
+
+    Chunkers collect every piece first, so total_chunks is known and written
+    as each chunk is created instead of in a second pass over the dicts.
+    """
+    if not pieces:
+        return []
+
+    # Every chunk's metadata has the same keys in the same order, so each one
+    # is a copy of this template (a flat table copy) with its own values
+    # assigned, rather than re-merging the base metadata key by key
+    template = {
+        **metadata,
+        "chunk_index": None,
+        **pieces[0][4],
+        "total_chunks": len(pieces),
+    }
+    id_prefix = f"{metadata.get('source_id', 'unknown')}_"
 
     chunks = []
-    for i, (title, content) in enumerate(sections):
-        if len(content) >= min_chunk_size:
-            start_pos = text.find(content)
-            end_pos = start_pos + len(content)
-
-            chunk = {
-                "text": content,
-                "chunk_id": f"{metadata.get('source_id', 'unknown')}_{i}",
+    for text, start_pos, end_pos, chunk_index, extra_metadata in pieces:
+        chunk_metadata = template.copy()
+        chunk_metadata["chunk_index"] = chunk_index
+        chunk_metadata.update(extra_metadata)
+        chunks.append(
+            {
+                "text": text,
+                "chunk_id": f"{id_prefix}{chunk_index}",
                 "start_pos": start_pos,
                 "end_pos": end_pos,
-                "metadata": {
-                    **metadata,
-                    "chunk_index": i,
-                    "section_title": title,
-                    "section_type": "item" if "Item" in title else "section",
-                },
+                "metadata": chunk_metadata,
             }
-            chunks.append(chunk)
-
-    # Update total_chunks for all chunks
-    for chunk in chunks:
-        chunk["metadata"]["total_chunks"] = len(chunks)
-
+        )
     return chunks
 
 
@@ -397,35 +451,53 @@ def _chunk_by_sections_aware(
     Returns:
         List of chunk dictionaries
     """
-    all_chunks = []
-
-    for section_name, section_content in sections_dict.items():
-        # Get the already-classified section type
-        section_type = section_types.get(section_name, SectionType.OTHER)
+    return list(_iter_chunks_by_sections_aware(sections_dict, section_types, metadata))
 
-        # Get optimal config for this section type
-        config = SECTION_CHUNK_CONFIGS[section_type]
-        chunk_size = config["chunk_size"]
-        overlap = config["overlap"]
 
+def _iter_chunks_by_sections_aware(
+    sections_dict: Dict[str, str],
+    section_types: Dict[str, SectionType],
+    metadata: Dict[str, Any],
+) -> Iterator[Dict[str, Any]]:
+    """Yield section-aware chunks one at a time, section by section."""
+    for section_content, chunk_size, overlap, section_metadata in _section_plans(
+        sections_dict, section_types, metadata
+    ):
         # Chunk this section with optimal config
-        section_chunks = _sliding_window_chunk_aware(
+        yield from _iter_sliding_window_chunks(
             section_content,
             chunk_size=chunk_size,
             overlap_size=overlap,
-            metadata={
-                **metadata,
-                "section": section_name,
-                "section_type": section_type.value,
-                "chunking_strategy": f"section_aware_{section_name}",
-                "optimal_chunk_size": chunk_size,
-                "optimal_overlap": overlap,
-            },
+            metadata=section_metadata,
         )
 
-        all_chunks.extend(section_chunks)
 
-    return all_chunks
+def _section_plans(
+    sections_dict: Dict[str, str],
+    section_types: Dict[str, SectionType],
+    metadata: Dict[str, Any],
+) -> Iterator[Tuple[str, int, int, Dict[str, Any]]]:
+    """
+    Yield (content, chunk_size, overlap, section_metadata) for each section,
+    using the optimal chunk config for its already-classified type.
+    """
+    for section_name, section_content in sections_dict.items():
+        # Get the already-classified section type
+        section_type = section_types.get(section_name, SectionType.OTHER)
+
+        # Get optimal config for this section type
+        chunk_size, overlap = get_optimal_chunk_config(section_type)
+
+        # Merge section-level keys once; each chunk then copies this base
+        section_metadata = metadata.copy()
+        section_metadata.update(
+            section=section_name,
+            section_type=section_type.value,
+            chunking_strategy=f"section_aware_{section_name}",
+            optimal_chunk_size=chunk_size,
+            optimal_overlap=overlap,
+        )
+        yield section_content, chunk_size, overlap, section_metadata
 
 
 def _sliding_window_chunk_aware(
@@ -446,49 +518,106 @@ def _sliding_window_chunk_aware(
     Returns:
         List of chunk dictionaries
     """
+    return list(_iter_sliding_window_chunks(text, chunk_size, overlap_size, metadata))
+
+
+def _iter_sliding_window_chunks(
+    text: str,
+    chunk_size: int = 1000,
+    overlap_size: int = 200,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield sliding window chunks lazily.
+
+    Window offsets are computed up front (plain ints, so total_chunks is known),
+    while chunk text and metadata are only built as each chunk is consumed.
+    """
+    if not text:
+        return
     if metadata is None:
         metadata = {}
 
-    chunks = []
+    windows = _sliding_window_offsets(text, chunk_size, overlap_size)
+    template = _window_metadata_template(metadata, overlap_size, len(windows))
+    id_prefix = str(metadata.get("source_id", "unknown")) + "_"
+
+    for chunk_id, (lo, hi, start, end) in enumerate(windows):
+        chunk_metadata = template.copy()
+        chunk_metadata["chunk_index"] = chunk_id
+        chunk_metadata["chunk_size"] = hi - lo
+        yield {
+            "text": text[lo:hi],
+            "chunk_id": id_prefix + str(chunk_id),
+            "start_pos": start,
+            "end_pos": end,
+            "metadata": chunk_metadata,
+        }
+
+
+def _window_metadata_template(
+    metadata: Dict[str, Any], overlap_size: int, total_chunks: int
+) -> Dict[str, Any]:
+    """
+    Metadata shared by every sliding window chunk of one text.
+
+    The window count is known up front, so total_chunks is written once per
+    chunk instead of in a second pass over the finished dicts. Each chunk's
+    metadata copies this template and fills in chunk_index and chunk_size.
+    """
+    return {
+        **metadata,
+        "chunk_index": None,
+        "chunk_size": None,
+        "overlap_size": overlap_size,
+        "total_chunks": total_chunks,
+    }
+
+
+def _sliding_window_offsets(
+    text: str,
+    chunk_size: int,
+    overlap_size: int,
+    min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE,
+) -> List[Tuple[int, int, int, int]]:
+    """
+    Compute sliding window offsets without slicing the text.
+
+    Returns (lo, hi, start, end) per kept window: start/end are the raw window
+    bounds and lo/hi the bounds with surrounding whitespace trimmed.
+    """
+    windows = []
     start = 0
-    chunk_id = 0
+    n = len(text)
 
-    while start < len(text):
-        end = min(start + chunk_size, len(text))
+    while start < n:
+        end = min(start + chunk_size, n)
+        if end <= start:  # Degenerate chunk size, nothing left to window
+            break
 
-        # Adjust end to preserve sentence boundaries
-        if end < len(text):
+        # Snap end back to the last sentence boundary inside the window
+        if end < n:
             end = _find_sentence_boundary(text, start, end)
 
-        chunk_text = text[start:end].strip()
-
-        if len(chunk_text) >= 100:  # Minimum chunk size
-            chunk = {
-                "text": chunk_text,
-                "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_id}",
-                "start_pos": start,
-                "end_pos": end,
-                "metadata": {
-                    **metadata,
-                    "chunk_index": chunk_id,
-                    "chunk_size": len(chunk_text),
-                    "overlap_size": overlap_size,
-                    "total_chunks": None,  # Will be set later
-                },
-            }
-            chunks.append(chunk)
-            chunk_id += 1
+        # Trim surrounding whitespace by index so each kept window is sliced
+        # exactly once and undersized windows are never sliced at all
+        lo, hi = start, end
+        while lo < hi and text[lo].isspace():
+            lo += 1
+        while hi > lo and text[hi - 1].isspace():
+            hi -= 1
 
-        # Move start position with overlap
-        start = end - overlap_size
-        if start >= end:  # Prevent infinite loop
-            start = end
+        if hi - lo >= min_chunk_size:
+            windows.append((lo, hi, start, end))
 
-    # Update total_chunks for all chunks
-    for chunk in chunks:
-        chunk["metadata"]["total_chunks"] = len(chunks)
+        if end >= n:
+            break
 
-    return chunks
+        # Move start position with overlap, always making forward progress
+        next_start = end - overlap_size
+        start = next_start if next_start > start else end
+
+    return windows
 
 
 def _chunk_semantic(
@@ -512,75 +641,175 @@ def _chunk_semantic(
     )
 
 
-def _split_into_sentences(text: str) -> List[str]:
-    """Split text into sentences."""
-    # Simple sentence splitting - can be improved with more sophisticated NLP
-    sentence_endings = r"[.!?]+"
-    sentences = re.split(sentence_endings, text)
-    return [s.strip() for s in sentences if s.strip()]
+def _sentence_spans(text: str) -> Iterator[Tuple[int, int]]:
+    """
+    Yield the (start, end) offsets in text of each sentence: the stripped,
+    non-blank runs between sentence-ending punctuation.
+    """
+    offset = 0
+    for match in _SENTENCE_END_PATTERN.finditer(text):
+        yield from _stripped_span(text, offset, match.start())
+        offset = match.end()
+    yield from _stripped_span(text, offset, len(text))
+
+
+@lru_cache(maxsize=16)
+def _sentence_span_table(text: str) -> Tuple[Tuple[int, int], ...]:
+    """
+    Sentence spans of text, cached so trying several sentence-based
+    strategies or chunk sizes on one filing splits it only once.
+    """
+    # Keyed on the text itself: str caches its hash, and a hit only costs
+    # one memcmp, so a separate content digest would not save a pass
+    return tuple(_sentence_spans(text))
+
+
+def _stripped_span(text: str, start: int, end: int) -> Iterator[Tuple[int, int]]:
+    """Yield the offsets of text[start:end] stripped, unless it is blank."""
+    piece = text[start:end]
+    sentence = piece.strip()
+    if sentence:
+        start += len(piece) - len(piece.lstrip())
+        yield start, start + len(sentence)
 
 
 def _find_sentence_boundary(text: str, start: int, end: int) -> int:
-    """Find the nearest sentence boundary within the given range."""
-    # Look for sentence endings before the end position
-    for i in range(end - 1, start, -1):
-        if text[i] in ".!?":
-            return i + 1
-    return end
+    """
+    Find the nearest sentence boundary within the given range.
 
+    Three C-level str.rfind calls search back from end, so only the window
+    itself is scanned and no per-text index has to be built first.
+    """
+    idx = max(
+        text.rfind(".", start, end),
+        text.rfind("!", start, end),
+        text.rfind("?", start, end),
+    )
+    return idx + 1 if idx > start else end
 
-def _get_overlap_sentences(sentences: List[str], overlap_size: int) -> List[str]:
-    """Get sentences for overlap based on overlap_size."""
-    if not sentences:
-        return []
 
+def _get_overlap_spans(
+    spans: List[Tuple[int, int]], overlap_size: int
+) -> List[Tuple[int, int]]:
+    """Get the trailing sentence spans for overlap based on overlap_size."""
+    # Walk back only as far as the overlap reaches, then take one slice
+    # instead of inserting each span at the front of a list
     overlap_chars = 0
-    overlap_sentences = []
+    count = 0
 
-    for sentence in reversed(sentences):
-        if overlap_chars + len(sentence) <= overlap_size:
-            overlap_sentences.insert(0, sentence)
-            overlap_chars += len(sentence)
-        else:
+    for start, end in reversed(spans):
+        overlap_chars += end - start
+        if overlap_chars > overlap_size:
             break
+        count += 1
 
-    return overlap_sentences
+    return spans[len(spans) - count :]
 
 
 def generate_embeddings(
     texts: List[str],
     model: EmbeddingModel = DEFAULT_EMBEDDING_MODEL,
-    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_size: Optional[int] = None,
     api_key: Optional[str] = None,
     normalize_embeddings: bool = True,
-) -> List[np.ndarray]:
+    cache: bool = True,
+) -> np.ndarray:
     """
     Generate embeddings for a list of texts.
 
     Args:
         texts: List of text strings
         model: Embedding model to use
-        batch_size: Batch size for processing
+        batch_size: Batch size for processing (default: DEFAULT_BATCH_SIZE,
+                    or sized from free GPU memory for Sentence Transformers)
         api_key: API key for OpenAI models
         normalize_embeddings: Whether to normalize embeddings
+        cache: Whether to reuse and store embeddings in the on-disk cache
+               under CACHE_DIR, keyed by each text's SHA-256
 
     Returns:
-        List of embedding vectors
+        float32 array of shape (len(texts), dimensions), one row per text
     """
     if not texts:
-        return []
+        return np.empty((0, 0), dtype=np.float32)
 
-    if model.value.startswith("text-embedding"):
-        return _generate_openai_embeddings(texts, model, batch_size, api_key)
-    else:
+    def encode(batch: List[str]) -> np.ndarray:
+        if model.value.startswith("text-embedding"):
+            return _generate_openai_embeddings(
+                batch, model, batch_size or DEFAULT_BATCH_SIZE, api_key
+            )
         return _generate_sentence_transformer_embeddings(
-            texts, model, batch_size, normalize_embeddings
+            batch, model, batch_size, normalize_embeddings
         )
 
+    if not cache:
+        return encode(texts)
+
+    # Unnormalized Sentence Transformers output is cached separately
+    cache_name = model.value
+    if not normalize_embeddings and not model.value.startswith("text-embedding"):
+        cache_name += "-unnormalized"
+    return _cached_embed(
+        texts, encode, os.path.join(CACHE_DIR, "embeddings", cache_name)
+    )
+
+
+def _cached_embed(
+    texts: List[str], encode_fn: Callable[[List[str]], np.ndarray], cache_dir: str
+) -> np.ndarray:
+    """
+    Embed texts through a per-text .npy cache, encoding only the misses.
+
+    Args:
+        texts: List of text strings
+        encode_fn: Function embedding a list of texts into a 2-D array
+        cache_dir: Cache directory for one model
+
+    Returns:
+        float32 array of shape (len(texts), dimensions), one row per text
+    """
+    paths = []
+    for text in texts:
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        paths.append(os.path.join(cache_dir, digest[:2], f"{digest}.npy"))
+
+    rows: List[Optional[np.ndarray]] = []
+    # Cache path -> text for every miss, so repeated texts are encoded once
+    missing: Dict[str, str] = {}
+    for text, path in zip(texts, paths):
+        try:
+            rows.append(np.load(path, allow_pickle=False))
+        except (OSError, ValueError):
+            rows.append(None)
+            missing[path] = text
+
+    if missing:
+        encoded = dict(zip(missing, encode_fn(list(missing.values()))))
+        for path, row in encoded.items():
+            # Zero rows mark failed API batches and must be retried next time
+            if row.any():
+                _save_cached_embedding(path, row)
+        rows = [encoded[path] if row is None else row for row, path in zip(rows, paths)]
+
+    return np.vstack(rows).astype(np.float32, copy=False)
+
+
+def _save_cached_embedding(path: str, row: np.ndarray) -> None:
+    """Write one embedding to the cache; failures only cost a re-encode."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see a partial row
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, row, allow_pickle=False)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write embedding cache entry %s: %s", path, e)
+
 
 def _generate_openai_embeddings(
     texts: List[str], model: EmbeddingModel, batch_size: int, api_key: Optional[str]
-) -> List[np.ndarray]:
+) -> np.ndarray:
     """Generate embeddings using OpenAI API."""
     if openai is None:
         raise ImportError(
@@ -590,46 +819,85 @@ def _generate_openai_embeddings(
     if not api_key:
         raise ValueError("OpenAI API key required for OpenAI models")
 
-    openai.api_key = api_key
-    embeddings = []
+    client = openai.OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES)
+    # Rows of failed batches stay as zero vectors
+    embeddings = np.zeros((len(texts), _OPENAI_EMBEDDING_DIMS[model]), dtype=np.float32)
 
-    for i in range(0, len(texts), batch_size):
+    def embed_batch(i: int) -> None:
         batch = texts[i : i + batch_size]
 
         try:
-            response = openai.Embedding.create(input=batch, model=model.value)
+            response = client.embeddings.create(input=batch, model=model.value)
 
-            batch_embeddings = [
-                np.array(item["embedding"]) for item in response["data"]
-            ]
-            embeddings.extend(batch_embeddings)
+            # Each batch owns a disjoint row range, so threads never overlap
+            embeddings[i : i + len(batch)] = [item.embedding for item in response.data]
 
         except Exception as e:
-            logger.error(f"Error generating OpenAI embeddings for batch {i}: {e}")
-            # Add zero vectors as fallback
-            embeddings.extend([np.zeros(1536) for _ in batch])
+            logger.error("Error generating OpenAI embeddings for batch %d: %s", i, e)
+
+    # Requests are network-bound, so several batches are kept in flight
+    batch_starts = range(0, len(texts), batch_size)
+    if len(batch_starts) > 1:
+        workers = min(MAX_EMBEDDING_WORKERS, len(batch_starts))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(embed_batch, batch_starts))
+    else:
+        for i in batch_starts:
+            embed_batch(i)
 
     return embeddings
 
 
 def _generate_sentence_transformer_embeddings(
-    texts: List[str], model: EmbeddingModel, batch_size: int, normalize_embeddings: bool
-) -> List[np.ndarray]:
+    texts: List[str],
+    model: EmbeddingModel,
+    batch_size: Optional[int],
+    normalize_embeddings: bool,
+) -> np.ndarray:
     """Generate embeddings using Sentence Transformers."""
     if SentenceTransformer is None:
         raise ImportError(
             "Sentence Transformers not available. Install with: pip install sentence-transformers"
         )
 
-    sentence_model = SentenceTransformer(model.value)
+    sentence_model = _get_sentence_model(model.value)
+    if batch_size is None:
+        batch_size = _auto_batch_size(sentence_model)
+    # encode() already sorts texts by length before batching and restores the
+    # input order, so batches are padded only to their own longest text
     embeddings = sentence_model.encode(
         texts,
         batch_size=batch_size,
         normalize_embeddings=normalize_embeddings,
         show_progress_bar=True,
+        convert_to_numpy=True,
     )
 
-    return [np.array(embedding) for embedding in embeddings]
+    return np.asarray(embeddings, dtype=np.float32)
+
+
+@lru_cache(maxsize=4)
+def _get_sentence_model(name: str) -> SentenceTransformer:
+    """Load a Sentence Transformers model once per process and reuse it."""
+    sentence_model = SentenceTransformer(name)
+    # One throwaway encode pays for lazy weight placement, kernel compilation
+    # and workspace allocation here instead of in the first real request
+    sentence_model.encode(["warmup"], batch_size=1, show_progress_bar=False)
+    return sentence_model
+
+
+def _auto_batch_size(sentence_model: SentenceTransformer) -> int:
+    """Pick an encode batch size for the model's device."""
+    if sentence_model.device.type != "cuda":
+        return DEFAULT_BATCH_SIZE
+
+    import torch
+
+    # Scale with free memory, allowing ~2 KiB per embedding dimension per text
+    free_bytes, _ = torch.cuda.mem_get_info(sentence_model.device)
+    dimensions = sentence_model.get_sentence_embedding_dimension() or 1
+    fitted = int(free_bytes // (dimensions * 2 * 1024))
+    return max(1, min(MAX_AUTO_BATCH_SIZE, fitted))
 
 
 def generate_single_embedding(
@@ -641,25 +909,131 @@ def generate_single_embedding(
     return generate_embeddings([text], model, api_key=api_key)[0]
 
 
-def save_chunks_to_file(chunks: List[Dict[str, Any]], filepath: str) -> None:
-    """Save chunks to a JSON file."""
+def save_chunks_to_file(chunks: Iterable[Dict[str, Any]], filepath: str) -> None:
+    """Save chunks to a newline-delimited JSON file, one chunk per line."""
+    # Without indent json uses its C encoder, and each chunk is written as it
+    # is encoded instead of building one string for the whole file
+    encode = json.JSONEncoder(default=str).encode
     with open(filepath, "w") as f:
-        json.dump(chunks, f, indent=2, default=str)
+        f.writelines(encode(chunk) + "\n" for chunk in chunks)
 
 
 def load_chunks_from_file(filepath: str) -> List[Dict[str, Any]]:
-    """Load chunks from a JSON file."""
+    """Load chunks saved by save_chunks_to_file, one chunk per line."""
     with open(filepath, "r") as f:
-        return json.load(f)
+        first_line = f.readline()
+        if first_line.lstrip().startswith("["):
+            # Files from older versions hold a single JSON array
+            return json.loads(first_line + f.read())
+        return [json.loads(line) for line in chain([first_line], f) if line.strip()]
+
+
+def save_embeddings(embeddings: np.ndarray, filepath: str) -> None:
+    """Save an embedding matrix as a float32 .npy file, row i for chunk i."""
+    np.save(filepath, np.ascontiguousarray(embeddings, dtype=np.float32))
+
+
+def load_embeddings(filepath: str, mmap: bool = True) -> np.ndarray:
+    """
+    Load an embedding matrix saved by save_embeddings.
+
+    Args:
+        filepath: Path to the .npy file
+        mmap: Whether to memory-map the file read-only instead of reading it,
+              so only the rows a search touches are paged in
+
+    Returns:
+        2-D array of embeddings, one row per chunk
+    """
+    return np.load(filepath, mmap_mode="r" if mmap else None, allow_pickle=False)
+
+
+# Rows dequantized per block when scoring int8 embeddings, so the float32
+# working copy stays small while each block still goes through BLAS
+QUANTIZED_BLOCK_ROWS = 8192
+
+
+@dataclass
+class QuantizedEmbeddings:
+    """
+    Int8 embeddings with one float32 scale per row.
+
+    Uses a quarter of the memory of float32 embeddings and can be passed to
+    search_similar_chunks in place of the array.
+    """
+
+    values: np.ndarray
+    scales: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def dot(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Return the dot product of every dequantized row with vector, or with
+        each column when given a (dimensions, n) matrix.
+        """
+        vector = np.asarray(vector, dtype=np.float32)
+        out = np.empty((len(self.values),) + vector.shape[1:], dtype=np.float32)
+        for i in range(0, len(self.values), QUANTIZED_BLOCK_ROWS):
+            block = self.values[i : i + QUANTIZED_BLOCK_ROWS].astype(np.float32)
+            out[i : i + QUANTIZED_BLOCK_ROWS] = block @ vector
+        return out * self.scales.reshape((-1,) + (1,) * (vector.ndim - 1))
+
+    def norms(self) -> np.ndarray:
+        """Return the L2 norm of every dequantized row."""
+        out = np.empty(len(self.values), dtype=np.float32)
+        for i in range(0, len(self.values), QUANTIZED_BLOCK_ROWS):
+            block = self.values[i : i + QUANTIZED_BLOCK_ROWS].astype(np.float32)
+            out[i : i + QUANTIZED_BLOCK_ROWS] = np.linalg.norm(block, axis=1)
+        return out * self.scales
+
+
+def quantize_embeddings(embeddings: np.ndarray) -> QuantizedEmbeddings:
+    """
+    Quantize embeddings to int8 with symmetric per-row scaling.
+
+    Args:
+        embeddings: 2-D array of embeddings, one row per chunk
+
+    Returns:
+        QuantizedEmbeddings holding the int8 rows and their scales
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    scales = np.abs(embeddings).max(axis=1, initial=0.0) / np.float32(127.0)
+    # All-zero rows (e.g. failed OpenAI batches) quantize to zeros
+    divisors = np.where(scales > 0, scales, np.float32(1.0))[:, None]
+    values = np.rint(embeddings / divisors).astype(np.int8)
+    return QuantizedEmbeddings(values=values, scales=scales)
+
+
+def embedding_inverse_norms(
+    embeddings: Union[np.ndarray, QuantizedEmbeddings],
+) -> np.ndarray:
+    """
+    Return 1 / L2 norm for every embedding row.
+
+    Compute once per embedding set and pass as inverse_norms to the search
+    functions so repeated queries skip the norm pass over the whole matrix.
+    """
+    if isinstance(embeddings, QuantizedEmbeddings):
+        norms = embeddings.norms()
+    else:
+        norms = np.linalg.norm(embeddings, axis=1)
+    # Zero rows get an infinite scale, so they score NaN as with a division
+    with np.errstate(divide="ignore"):
+        return np.reciprocal(norms)
 
 
 def search_similar_chunks(
     query: str,
     chunks: List[Dict[str, Any]],
-    embeddings: np.ndarray,
+    embeddings: Union[np.ndarray, QuantizedEmbeddings],
     query_embedding: np.ndarray,
     top_k: int = 5,
     similarity_threshold: float = 0.0,
+    pre_normalized: bool = False,
+    inverse_norms: Optional[np.ndarray] = None,
 ) -> List[Tuple[Dict[str, Any], float]]:
     """
     Search for similar chunks using cosine similarity.
@@ -667,31 +1041,234 @@ def search_similar_chunks(
     Args:
         query: Search query
         chunks: List of chunk dictionaries
-        embeddings: Array of chunk embeddings
+        embeddings: 2-D array of chunk embeddings, one row per chunk, or their
+                    quantize_embeddings() form
         query_embedding: Query embedding vector
         top_k: Number of top results to return
         similarity_threshold: Minimum similarity score
+        pre_normalized: Whether embeddings are already unit length (e.g. from
+                        generate_embeddings with normalize_embeddings=True), in
+                        which case the per-row norm pass is skipped
+        inverse_norms: Precomputed embedding_inverse_norms(embeddings), reused
+                       across queries instead of recomputing the row norms
 
     Returns:
         List of (chunk, similarity_score) tuples
     """
-    if not chunks or embeddings is None:
-        return []
+    return search_similar_chunks_batch(
+        [query],
+        chunks,
+        embeddings,
+        np.asarray(query_embedding)[np.newaxis, :],
+        top_k,
+        similarity_threshold,
+        pre_normalized,
+        inverse_norms,
+    )[0]
+
+
+def search_similar_chunks_batch(
+    queries: List[str],
+    chunks: List[Dict[str, Any]],
+    embeddings: Union[np.ndarray, QuantizedEmbeddings],
+    query_embeddings: np.ndarray,
+    top_k: int = 5,
+    similarity_threshold: float = 0.0,
+    pre_normalized: bool = False,
+    inverse_norms: Optional[np.ndarray] = None,
+) -> List[List[Tuple[Dict[str, Any], float]]]:
+    """
+    Search for several queries at once using cosine similarity.
+
+    All queries are scored in one matrix product, so the embedding matrix is
+    read once per batch instead of once per query.
 
-    # Calculate cosine similarities
-    similarities = np.dot(embeddings, query_embedding) / (
-        np.linalg.norm(embeddings, axis=1) * np.linalg.norm(query_embedding)
+    Args:
+        queries: Search queries
+        chunks: List of chunk dictionaries
+        embeddings: 2-D array of chunk embeddings, one row per chunk, or their
+                    quantize_embeddings() form
+        query_embeddings: 2-D array of query embeddings, one row per query
+        top_k: Number of top results to return per query
+        similarity_threshold: Minimum similarity score
+        pre_normalized: Whether embeddings are already unit length
+        inverse_norms: Precomputed embedding_inverse_norms(embeddings)
+
+    Returns:
+        One list of (chunk, similarity_score) tuples per query
+    """
+    if not chunks or embeddings is None or top_k <= 0:
+        return [[] for _ in queries]
+
+    # Queries are normalized up front; float embeddings keep their own dtype
+    # so a float32 matrix is not upcast to float64 for the product
+    query_embeddings = np.asarray(query_embeddings)
+    query_embeddings = query_embeddings / np.linalg.norm(
+        query_embeddings, axis=1, keepdims=True
     )
+    if isinstance(embeddings, QuantizedEmbeddings):
+        similarities = embeddings.dot(query_embeddings.T)
+    else:
+        embeddings = np.ascontiguousarray(embeddings)
+        if np.issubdtype(embeddings.dtype, np.floating):
+            query_embeddings = query_embeddings.astype(embeddings.dtype, copy=False)
+        similarities = embeddings @ query_embeddings.T
+
+    # Scale by 1/|row| with one multiply; the norms are only swept when the
+    # caller has not precomputed them
+    if not pre_normalized:
+        if inverse_norms is None:
+            inverse_norms = embedding_inverse_norms(embeddings)
+        similarities *= inverse_norms[:, np.newaxis]
+    similarities = similarities.T
+
+    # Select each query's top-k without sorting every score, then order those
+    k = min(top_k, similarities.shape[1])
+    top_indices = np.argpartition(-similarities, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(similarities, top_indices, axis=1)
+    order = np.argsort(-top_scores, axis=1)
+    top_indices = np.take_along_axis(top_indices, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    return [
+        [
+            (chunks[idx], float(score))
+            for idx, score in zip(index_row, score_row)
+            if score >= similarity_threshold
+        ]
+        for index_row, score_row in zip(top_indices.tolist(), top_scores.tolist())
+    ]
+
+
+# Below this many rows one matrix product over every embedding is about as
+# fast as an approximate index, so build_index keeps the exact search
+ANN_MIN_ROWS = 5000
+# HNSW graph degree, candidate list size while building, and candidate list
+# size searched per query (raised to top_k when more results are asked for);
+# larger lists trade speed for recall
+HNSW_NEIGHBORS = 32
+HNSW_EF_CONSTRUCTION = 100
+HNSW_EF_SEARCH = 128
+
+
+@dataclass
+class EmbeddingIndex:
+    """
+    Embeddings prepared once for repeated searches with
+    search_similar_chunks_ann.
+
+    faiss_index is an HNSW index over the unit-length rows when faiss is
+    installed and there are at least ANN_MIN_ROWS of them; otherwise it is
+    None and searches scan embeddings exactly, reusing inverse_norms.
+    """
+
+    embeddings: Union[np.ndarray, QuantizedEmbeddings]
+    pre_normalized: bool = False
+    inverse_norms: Optional[np.ndarray] = None
+    faiss_index: Any = None
 
-    # Get top-k results above threshold
-    top_indices = np.argsort(similarities)[::-1]
-    results = []
+    def __len__(self) -> int:
+        return len(self.embeddings)
 
-    for idx in top_indices:
-        if similarities[idx] >= similarity_threshold and len(results) < top_k:
-            results.append((chunks[idx], float(similarities[idx])))
 
-    return results
+def build_index(
+    embeddings: Union[np.ndarray, QuantizedEmbeddings],
+    pre_normalized: bool = False,
+    min_rows: int = ANN_MIN_ROWS,
+) -> EmbeddingIndex:
+    """
+    Build a search index over chunk embeddings.
+
+    Args:
+        embeddings: 2-D array of chunk embeddings, one row per chunk, or their
+                    quantize_embeddings() form (always searched exactly)
+        pre_normalized: Whether embeddings are already unit length
+        min_rows: Smallest number of rows worth an approximate index
+
+    Returns:
+        EmbeddingIndex to pass to search_similar_chunks_ann
+    """
+    if len(embeddings) >= min_rows and not isinstance(embeddings, QuantizedEmbeddings):
+        try:
+            import faiss
+        except ImportError:
+            faiss = None
+            logger.info("faiss not installed, searching embeddings exactly")
+
+        if faiss is not None:
+            # faiss wants contiguous float32 and normalizes in place, so the
+            # caller's (possibly memory-mapped) array is copied first
+            vectors = np.array(embeddings, dtype=np.float32, order="C")
+            if not pre_normalized:
+                faiss.normalize_L2(vectors)
+            faiss_index = faiss.IndexHNSWFlat(
+                vectors.shape[1], HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+            )
+            faiss_index.hnsw.efConstruction = HNSW_EF_CONSTRUCTION
+            faiss_index.add(vectors)
+            return EmbeddingIndex(embeddings, True, faiss_index=faiss_index)
+
+    inverse_norms = None if pre_normalized else embedding_inverse_norms(embeddings)
+    return EmbeddingIndex(embeddings, pre_normalized, inverse_norms)
+
+
+def search_similar_chunks_ann(
+    queries: List[str],
+    chunks: List[Dict[str, Any]],
+    index: EmbeddingIndex,
+    query_embeddings: np.ndarray,
+    top_k: int = 5,
+    similarity_threshold: float = 0.0,
+) -> List[List[Tuple[Dict[str, Any], float]]]:
+    """
+    Search for several queries against a prebuilt index.
+
+    With an HNSW index each query visits a small part of the graph instead of
+    every row, so results are approximate; without one this is exactly
+    search_similar_chunks_batch.
+
+    Args:
+        queries: Search queries
+        chunks: List of chunk dictionaries, in embedding row order
+        index: Index from build_index over the chunks' embeddings
+        query_embeddings: 2-D array of query embeddings, one row per query
+        top_k: Number of top results to return per query
+        similarity_threshold: Minimum similarity score
+
+    Returns:
+        One list of (chunk, similarity_score) tuples per query
+    """
+    if index.faiss_index is None:
+        return search_similar_chunks_batch(
+            queries,
+            chunks,
+            index.embeddings,
+            query_embeddings,
+            top_k,
+            similarity_threshold,
+            index.pre_normalized,
+            index.inverse_norms,
+        )
+    if not chunks or top_k <= 0:
+        return [[] for _ in queries]
+
+    import faiss
+
+    query_embeddings = np.array(query_embeddings, dtype=np.float32, order="C")
+    faiss.normalize_L2(query_embeddings)
+    k = min(top_k, len(chunks))
+    params = faiss.SearchParametersHNSW(efSearch=max(HNSW_EF_SEARCH, k))
+    scores, indices = index.faiss_index.search(query_embeddings, k, params=params)
+
+    # Missing neighbours come back as index -1
+    return [
+        [
+            (chunks[idx], float(score))
+            for idx, score in zip(index_row, score_row)
+            if idx >= 0 and score >= similarity_threshold
+        ]
+        for index_row, score_row in zip(indices.tolist(), scores.tolist())
+    ]
 
 
 def process_text_pipeline(
@@ -702,10 +1279,10 @@ def process_text_pipeline(
     min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE,
     max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
     embedding_model: EmbeddingModel = DEFAULT_EMBEDDING_MODEL,
-    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_size: Optional[int] = None,
     api_key: Optional[str] = None,
     metadata: Optional[Dict[str, Any]] = None,
-) -> Tuple[List[Dict[str, Any]], List[np.ndarray]]:
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
     """
     Process text through the complete vectorization pipeline.
 
@@ -717,7 +1294,7 @@ def process_text_pipeline(
         min_chunk_size: Minimum chunk size
         max_chunk_size: Maximum chunk size
         embedding_model: Embedding model to use
-        batch_size: Batch size for embeddings
+        batch_size: Batch size for embeddings (default: chosen per model)
         api_key: API key for OpenAI models
         metadata: Optional metadata
 
@@ -732,7 +1309,7 @@ def process_text_pipeline(
         metadata["source_id"] = hashlib.md5(text.encode()).hexdigest()[:8]
 
     # Chunk the text
-    logger.info(f"Chunking text with strategy: {strategy.value}")
+    logger.info("Chunking text with strategy: %s", strategy.value)
     chunks = chunk_text(
         text,
         strategy,
@@ -742,21 +1319,108 @@ def process_text_pipeline(
         max_chunk_size,
         metadata,
     )
-    logger.info(f"Created {len(chunks)} chunks")
+    logger.info("Created %d chunks", len(chunks))
 
     # Generate embeddings
     texts = [chunk["text"] for chunk in chunks]
-    logger.info(f"Generating embeddings for {len(texts)} chunks")
+    logger.info("Generating embeddings for %d chunks", len(texts))
     embeddings = generate_embeddings(texts, embedding_model, batch_size, api_key)
 
     return chunks, embeddings
 
 
+def process_text_pipeline_batch(
+    texts: List[str],
+    strategy: ChunkingStrategy = ChunkingStrategy.SENTENCE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    overlap_size: int = DEFAULT_OVERLAP_SIZE,
+    min_chunk_size: int = DEFAULT_MIN_CHUNK_SIZE,
+    max_chunk_size: int = DEFAULT_MAX_CHUNK_SIZE,
+    embedding_model: EmbeddingModel = DEFAULT_EMBEDDING_MODEL,
+    batch_size: Optional[int] = None,
+    api_key: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    """
+    Process many documents, chunking them in parallel and embedding them together.
+
+    Chunking is CPU-bound Python and regex work, so documents are spread over a
+    process pool; all chunks are then embedded in a single generate_embeddings
+    call so the model sees full batches.
+
+    Args:
+        texts: Input documents to process
+        strategy: Chunking strategy
+        chunk_size: Target chunk size
+        overlap_size: Overlap between chunks
+        min_chunk_size: Minimum chunk size
+        max_chunk_size: Maximum chunk size
+        embedding_model: Embedding model to use
+        batch_size: Batch size for embeddings (default: chosen per model)
+        api_key: API key for OpenAI models
+        metadata: Optional metadata shared by every document; each document's
+                  source_id (the one given here, or a hash of its text) is
+                  suffixed with its document_index
+        max_workers: Number of chunking processes (default: one per CPU)
+
+    Returns:
+        Tuple of (chunks, embeddings) across all documents; each chunk's
+        metadata carries the document_index of the text it came from
+    """
+    metadata = dict(metadata or {})
+
+    # chunk_ids are built from source_id and restart at 0 for every document,
+    # so each document needs its own: the document index is appended to the
+    # shared source_id, or to a hash of the text, which repeats for duplicate
+    # filings
+    shared_source_id = metadata.pop("source_id", None)
+    document_metadata = [
+        {
+            **metadata,
+            "source_id": (
+                f"{shared_source_id}-{i}"
+                if shared_source_id is not None
+                else f"{hashlib.md5(text.encode()).hexdigest()[:8]}-{i}"
+            ),
+            "document_index": i,
+        }
+        for i, text in enumerate(texts)
+    ]
+
+    logger.info("Chunking %d documents with strategy: %s", len(texts), strategy.value)
+    chunk_args = (
+        texts,
+        repeat(strategy),
+        repeat(chunk_size),
+        repeat(overlap_size),
+        repeat(min_chunk_size),
+        repeat(max_chunk_size),
+        document_metadata,
+    )
+    if len(texts) > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_lists = list(executor.map(chunk_text, *chunk_args))
+    else:
+        chunk_lists = list(map(chunk_text, *chunk_args))
+
+    chunks = [chunk for document_chunks in chunk_lists for chunk in document_chunks]
+    logger.info("Created %d chunks", len(chunks))
+
+    # Generate embeddings for every document in one pass
+    chunk_texts = [chunk["text"] for chunk in chunks]
+    logger.info("Generating embeddings for %d chunks", len(chunk_texts))
+    embeddings = generate_embeddings(chunk_texts, embedding_model, batch_size, api_key)
+
+    return chunks, embeddings
+
+
 def process_sec_filing_sections(
     sections_dict: Dict[str, str],
     section_types: Dict[str, SectionType],
     metadata: Optional[Dict[str, Any]] = None,
-) -> List[Dict[str, Any]]:
+    columnar: bool = False,
+) -> Union[List[Dict[str, Any]], "ChunkColumns"]:
     """
     Process SEC filing sections with optimal chunking per section type.
 
@@ -764,34 +1428,154 @@ def process_sec_filing_sections(
         sections_dict: Dictionary of {section_name: section_content}
         section_types: Dictionary of {section_name: SectionType} (already classified)
         metadata: Optional base metadata
+        columnar: Return a ChunkColumns instead of a list of chunk dictionaries
 
     Returns:
-        List of all chunks from all sections
+        All chunks from all sections, as a list or a ChunkColumns
+    """
+    logger.info(
+        "Processing %d SEC filing sections with section-aware chunking",
+        len(sections_dict),
+    )
+
+    if columnar:
+        chunks = ChunkColumns.from_sections(
+            sections_dict,
+            section_types,
+            {**(metadata or {}), "processing_type": "sec_filing_sections"},
+        )
+    else:
+        chunks = list(iter_sec_filing_sections(sections_dict, section_types, metadata))
+
+    logger.info("Created %d chunks from SEC filing sections", len(chunks))
+    return chunks
+
+
+def iter_sec_filing_sections(
+    sections_dict: Dict[str, str],
+    section_types: Dict[str, SectionType],
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream SEC filing section chunks without materializing the full list.
+
+    Takes the same arguments as process_sec_filing_sections, so callers such as
+    embedding batchers can start consuming chunks before the last section is cut.
     """
     if metadata is None:
         metadata = {}
 
-    logger.info(
-        f"Processing {len(sections_dict)} SEC filing sections with section-aware chunking"
+    return _iter_chunks_by_sections_aware(
+        sections_dict,
+        section_types,
+        {**metadata, "processing_type": "sec_filing_sections"},
     )
 
-    chunks = chunk_text(
-        text="",  # Not used in SECTION_AWARE strategy
-        strategy=ChunkingStrategy.SECTION_AWARE,
-        sections_dict=sections_dict,
-        section_types=section_types,
-        metadata={
-            **metadata,
-            "processing_type": "sec_filing_sections",
-        },
-    )
 
-    logger.info(f"Created {len(chunks)} chunks from SEC filing sections")
-    return chunks
+@dataclass
+class ChunkColumns:
+    """
+    Section-aware chunks stored as columns.
+
+    Each chunk is a row of int32 offsets into its section's text plus its
+    section number; texts and section-level metadata are held once per
+    section. Chunk dictionaries, identical to those iter_sec_filing_sections
+    yields, are only built when a chunk is indexed.
+
+    Example:
+        columns = process_sec_filing_sections(sections, types, columnar=True)
+        embeddings = generate_embeddings(columns.texts())
+    """
+
+    section_texts: List[str]
+    # One metadata template per section, shared by all of its chunks
+    section_metadata: List[Dict[str, Any]]
+    section_index: np.ndarray
+    # Trimmed text bounds, then the raw window bounds reported as positions
+    lo: np.ndarray
+    hi: np.ndarray
+    start_pos: np.ndarray
+    end_pos: np.ndarray
+    chunk_index: np.ndarray
+
+    @classmethod
+    def from_sections(
+        cls,
+        sections_dict: Dict[str, str],
+        section_types: Dict[str, SectionType],
+        metadata: Dict[str, Any],
+    ) -> "ChunkColumns":
+        """Chunk every section straight into columns, without chunk dicts."""
+        section_texts, section_metadata, offsets, section_index = [], [], [], []
+        for content, chunk_size, overlap, base_metadata in _section_plans(
+            sections_dict, section_types, metadata
+        ):
+            windows = _sliding_window_offsets(content, chunk_size, overlap)
+            if not windows:
+                continue
+            section_index.append(
+                np.full(len(windows), len(section_texts), dtype=np.int32)
+            )
+            offsets.append(np.array(windows, dtype=np.int32))
+            section_texts.append(content)
+            section_metadata.append(
+                _window_metadata_template(base_metadata, overlap, len(windows))
+            )
+
+        # (lo, hi, start, end) rows plus each chunk's index within its section
+        offsets = np.concatenate(offsets or [np.empty((0, 4), dtype=np.int32)])
+        chunk_index = np.concatenate(
+            [np.arange(len(part), dtype=np.int32) for part in section_index]
+            or [np.empty(0, dtype=np.int32)]
+        )
+        return cls(
+            section_texts=section_texts,
+            section_metadata=section_metadata,
+            section_index=np.concatenate(
+                section_index or [np.empty(0, dtype=np.int32)]
+            ),
+            lo=offsets[:, 0],
+            hi=offsets[:, 1],
+            start_pos=offsets[:, 2],
+            end_pos=offsets[:, 3],
+            chunk_index=chunk_index,
+        )
+
+    def __len__(self) -> int:
+        return len(self.section_index)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        section = int(self.section_index[index])
+        lo, hi = int(self.lo[index]), int(self.hi[index])
+        chunk_index = int(self.chunk_index[index])
+
+        metadata = self.section_metadata[section].copy()
+        metadata["chunk_index"] = chunk_index
+        metadata["chunk_size"] = hi - lo
+        return {
+            "text": self.section_texts[section][lo:hi],
+            "chunk_id": f"{metadata.get('source_id', 'unknown')}_{chunk_index}",
+            "start_pos": int(self.start_pos[index]),
+            "end_pos": int(self.end_pos[index]),
+            "metadata": metadata,
+        }
+
+    def texts(self) -> List[str]:
+        """Return every chunk's text, in order, e.g. for generate_embeddings."""
+        section_texts = self.section_texts
+        return [
+            section_texts[section][lo:hi]
+            for section, lo, hi in zip(
+                self.section_index.tolist(), self.lo.tolist(), self.hi.tolist()
+            )
+        ]
 
 
 # Example usage and CLI
 def main():
+    # Progress logging is opt-in for library callers; the CLI turns it on
+    logging.basicConfig(level=logging.INFO)
+
     parser = argparse.ArgumentParser(description="Text Vectorization Utility")
     parser.add_argument("--text", help="Text to vectorize")
     parser.add_argument("--file", help="File containing text to vectorize")
@@ -805,6 +1589,10 @@ def main():
     parser.add_argument("--chunk-size", type=int, default=1000, help="Chunk size")
     parser.add_argument("--overlap-size", type=int, default=200, help="Overlap size")
     parser.add_argument("--top-k", type=int, default=5, help="Number of search results")
+    parser.add_argument(
+        "--index-dir",
+        help="Directory to save chunks and embeddings to, and to search with --query",
+    )
 
     args = parser.parse_args()
 
@@ -825,16 +1613,48 @@ def main():
         )
         print("Processed {} chunks".format(len(chunks)))
 
-        for i, chunk in enumerate(chunks):
-            print(f"\nChunk {i + 1}:")
-            print(f"ID: {chunk['chunk_id']}")
-            print(f"Text: {chunk['text'][:200]}...")
-            print(f"Metadata: {chunk['metadata']}")
+        # Build the chunk report up front and write it in one call
+        sys.stdout.write(
+            "".join(
+                f"\nChunk {i + 1}:\n"
+                f"ID: {chunk['chunk_id']}\n"
+                f"Text: {chunk['text'][:200]}...\n"
+                f"Metadata: {chunk['metadata']}\n"
+                for i, chunk in enumerate(chunks)
+            )
+        )
+
+        if args.index_dir:
+            os.makedirs(args.index_dir, exist_ok=True)
+            save_chunks_to_file(chunks, os.path.join(args.index_dir, "chunks.ndjson"))
+            save_embeddings(embeddings, os.path.join(args.index_dir, "embeddings.npy"))
+            print(f"Saved chunks and embeddings to {args.index_dir}")
 
     if args.query:
-        # Search (would need to load existing chunks/embeddings)
-        print("Search functionality requires loading existing chunks and embeddings")
         print(f"Query: '{args.query}'")
+        if not args.index_dir:
+            print("Search requires --index-dir with saved chunks and embeddings")
+        else:
+            # Chunks and embedding rows are stored in the same order
+            chunks = load_chunks_from_file(
+                os.path.join(args.index_dir, "chunks.ndjson")
+            )
+            embeddings = load_embeddings(os.path.join(args.index_dir, "embeddings.npy"))
+            results = search_similar_chunks(
+                args.query,
+                chunks,
+                embeddings,
+                generate_single_embedding(args.query),
+                top_k=args.top_k,
+                pre_normalized=True,
+            )
+            sys.stdout.write(
+                "".join(
+                    f"\nScore {score:.4f} - {chunk['chunk_id']}:\n"
+                    f"{chunk['text'][:200]}...\n"
+                    for chunk, score in results
+                )
+            )
 
     print("\nVectorization utility completed!")
 